@@ -27,6 +27,27 @@ PROTOCOL_VERSION = 3
 
 
 class OcpObject:
+    # many thousand objects per assembly: no per instance __dict__
+    __slots__ = (
+        "id",
+        "obj",
+        "kind",
+        "ref",
+        "cache_id",
+        "name",
+        "state_faces",
+        "state_edges",
+        "loc",
+        "color",
+        "width",
+        # set by ImageFace.to_ocp only
+        "image",
+        "image_type",
+        "image_width",
+        "image_height",
+        "height",
+    )
+
     def __init__(
         self,
         kind,
@@ -165,6 +186,8 @@ class OcpObject:
 
 
 class OcpGroup:
+    __slots__ = ("id", "objects", "name", "kind", "loc")
+
     def __init__(self, objs=None, name="Group", loc=None):
         self.id = None
         self.objects = [] if objs is None else objs
@@ -136,7 +136,7 @@ def get_kind(typ: str) -> str:
 
 
 def unwrap(
-    obj: Union[TopoDS_Shape, List[TopoDS_Shape], ShapeLike, List[ShapeLike]]
+    obj: Union[TopoDS_Shape, List[TopoDS_Shape], ShapeLike, List[ShapeLike]],
 ) -> Union[TopoDS_Shape, List[TopoDS_Shape]]:
     """
     Unwrap the object or objects in a list  if it is wrapped.
@@ -162,9 +162,10 @@ def create_cache_id(obj: TopoDS_Shape) -> str:
     @return: The unique id of the object
     """
     sha = sha256()
-    objs = [obj] if not isinstance(obj, (tuple, list)) else obj
-    for o in objs:
-        sha.update(serialize(o.wrapped if is_wrapped(o) else o))
+    if isinstance(obj, (tuple, list)):
+        sha.update(serialize_many([o.wrapped if is_wrapped(o) else o for o in obj]))
+    else:
+        sha.update(serialize(obj.wrapped if is_wrapped(obj) else obj))
 
     return sha.hexdigest()
 
@@ -177,6 +178,8 @@ class OcpConverter:
         @param progress: The progress class to provide updates during the conversion
         """
         self.instances: List[TopoDS_Shape] = []
+        # TShape handle -> index into self.instances (the key pins the handle)
+        self.instance_refs: Dict[Any, int] = {}
         self.ocp = None
         self.progress = progress
         self.default_color = get_default("default_color")
@@ -197,26 +200,22 @@ class OcpConverter:
 
         @return: The reference to the object in the instances list and the location
         """
-        ref = None
-
         # Create the relocated object as a copy
         loc = obj.Location()  # Get location
         obj2 = downcast(obj.Moved(loc.Inverted()))
 
         # check if the same instance is already available
-        for i, instance in enumerate(self.instances):
-            if instance["obj"].TShape() == obj2.TShape():
-                ref = i
-
-                if self.progress is not None:
-                    self.progress.update("-")
+        tshape = obj2.TShape()
+        ref = self.instance_refs.get(tshape)
+        if ref is not None:
+            if self.progress is not None:
+                self.progress.update("-")
 
-                break
-
-        if ref is None:
+        else:
             # append the new instance
             ref = len(self.instances)
             self.instances.append({"obj": obj2, "cache_id": cache_id, "name": name})
+            self.instance_refs[tshape] = ref
 
         return ref, loc
 
@@ -1009,6 +1008,7 @@ class OcpConverter:
         cad_objs = []
         names: List[str | None] = []
         bb = BoundingBox()
+        bb_shapes = []
         size = 5
         for typ, objs, calc_bb in [
             ("Face", list(cad_obj._faces), True),
@@ -1038,8 +1038,10 @@ class OcpConverter:
                 names.append(typ)
 
                 if calc_bb:
-                    bb.update(BoundingBox(compound))
+                    bb_shapes.append(compound)
 
+        if bb_shapes:
+            bb.update(BoundingBox.from_compound(bb_shapes))
         size = max(bb.xsize, bb.ysize, bb.zsize, 0.1)
 
         name = get_name(cad_obj, obj_name, "Sketch")
@@ -1320,7 +1322,7 @@ class OcpConverter:
                     is_build123d_shapelist(cad_obj)
                     and all(type(cad_obj[0]) == type(o) for o in cad_obj)
                 )
-                and not any([class_name(o) == "Compound" for o in cad_obj])
+                and not any(class_name(o) == "Compound" for o in cad_obj)
             ):
                 ocp_obj = self.handle_list_tuple(
                     cad_obj, obj_name, color, alpha, sketch_local, helper_scale, level
@@ -15,9 +15,7 @@
 #
 
 import io
-import itertools
 import os
-import sys
 import tempfile
 from collections.abc import Iterable
 
@@ -91,7 +89,7 @@ from OCP.TopTools import (  # type: ignore
     TopTools_IndexedMapOfShape,
 )
 
-from .utils import Color, class_name, distance, flatten, type_name
+from .utils import Color, class_name, flatten, type_name
 
 #
 # %% Version
@@ -107,8 +105,16 @@ def occt_version():
 #
 
 
+# sentinel for getattr lookups, cheaper than hasattr followed by getattr
+_MISSING = object()
+
+
+# evaluated once, hash_compat is called in cache key functions
+_IS_OCCT_77 = OCP.__version__.startswith("7.7")
+
+
 def hash_compat(obj):
-    if OCP.__version__.startswith("7.7"):
+    if _IS_OCCT_77:
         MAX_HASH_KEY = 2147483647
         return obj.HashCode(MAX_HASH_KEY)
     else:
@@ -116,6 +122,9 @@ def hash_compat(obj):
 
 
 def ocp_hash(obj):
+    # The OCCT hash only combines the TShape pointer and the location, so it is
+    # O(1). Note: id(obj.TShape()) is no alternative, the Python wrapper of the
+    # TShape is recreated once released and its id is not stable.
     if is_topods_solid(obj) or is_topods_face(obj) or is_topods_shell(obj):
         return hash_compat(obj)
     else:
@@ -162,13 +171,34 @@ def copy_shape(obj):
     return result
 
 
+def _tshape_of_workplane(obj):
+    return obj.val().wrapped.TShape()
+
+
+def _tshape_of_wrapped(obj):
+    return obj.wrapped.TShape()
+
+
+def _tshape_of_topods(obj):
+    return obj.TShape()
+
+
+# accessor per class, detected on first use of a class
+_tshape_dispatch = {}
+
+
 def get_tshape(obj):
-    if hasattr(obj, "val"):
-        return obj.val().wrapped.TShape()
-    elif hasattr(obj, "wrapped"):
-        return obj.wrapped.TShape()
-    else:
-        return obj.TShape()
+    accessor = _tshape_dispatch.get(type(obj))
+    if accessor is None:
+        if hasattr(obj, "val"):
+            accessor = _tshape_of_workplane
+        elif hasattr(obj, "wrapped"):
+            accessor = _tshape_of_wrapped
+        else:
+            accessor = _tshape_of_topods
+        _tshape_dispatch[type(obj)] = accessor
+
+    return accessor(obj)
 
 
 def normalized(v):
@@ -184,29 +214,34 @@ def cross(v1, v2):
     return y.Coord()
 
 
-def _has(obj, attrs):
-    return all([hasattr(obj, a) for a in attrs])
-
-
 #
 # %% Library identifiers
 #
 
 
 def is_cadquery(obj):
-    return _has(obj, ["objects", "ctx", "val"])
+    return hasattr(obj, "objects") and hasattr(obj, "ctx") and hasattr(obj, "val")
 
 
 def is_cadquery_shape(obj):
-    return _has(obj, ["wrapped", "forConstruction"]) and is_topods_shape(obj.wrapped)
+    return (
+        hasattr(obj, "wrapped")
+        and hasattr(obj, "forConstruction")
+        and is_topods_shape(obj.wrapped)
+    )
 
 
 def is_cadquery_assembly(obj):
-    return _has(obj, ["obj", "loc", "name", "children"])
+    return (
+        hasattr(obj, "obj")
+        and hasattr(obj, "loc")
+        and hasattr(obj, "name")
+        and hasattr(obj, "children")
+    )
 
 
 def is_cadquery_massembly(obj):
-    return _has(obj, ["obj", "loc", "name", "children", "mates"])
+    return is_cadquery_assembly(obj) and hasattr(obj, "mates")
 
 
 def is_cadquery_sketch(obj):
@@ -226,7 +261,7 @@ def is_vector(obj):
 
 
 def is_massembly(obj):
-    return _has(obj, ["obj", "loc", "name", "children", "mates"])
+    return is_cadquery_assembly(obj) and hasattr(obj, "mates")
 
 
 def is_wrapped(obj):
@@ -234,7 +269,12 @@ def is_wrapped(obj):
 
 
 def is_build123d(obj):
-    return _has(obj, ["_obj", "_obj_name", "_tag"]) and not isinstance(obj, type)
+    return (
+        hasattr(obj, "_obj")
+        and hasattr(obj, "_obj_name")
+        and hasattr(obj, "_tag")
+        and not isinstance(obj, type)
+    )
 
 
 def is_build123d_part(obj):
@@ -250,7 +290,11 @@ def is_build123d_line(obj):
 
 
 def is_build123d_shape(obj):
-    return _has(obj, ["wrapped", "children"]) and is_topods_shape(obj.wrapped)
+    return (
+        hasattr(obj, "wrapped")
+        and hasattr(obj, "children")
+        and is_topods_shape(obj.wrapped)
+    )
 
 
 def is_build123d_shell(obj):
@@ -340,6 +384,14 @@ def is_topods_vertex(topods_shape):
     return isinstance(topods_shape, TopoDS_Vertex)
 
 
+def _tshape_key(topods_shape):
+    tshape = topods_shape.TShape()
+    # keep the TShape handle in the key to pin its id (see _shape_key)
+    return (id(tshape), tshape)
+
+
+# the curve type only depends on the TShape, not on location or orientation
+@cached(LRUCache(maxsize=4096), key=_tshape_key)
 def is_line(topods_shape):
     c = BRepAdaptor_Curve(topods_shape)
     return c.GetType() == GeomAbs_CurveType.GeomAbs_Line
@@ -421,66 +473,82 @@ def extent_or_size(obj):
         raise ValueError(f"Unknown type {type(obj)}")
 
 
-def get_compounds(shape):
-    compound_map = TopTools_IndexedMapOfShape()
-    TopExp.MapShapes_s(shape, TopAbs_COMPOUND, compound_map)
+class _TopologyKey:
+    # Cache key for the sub shape maps. The hash of a shape combines TShape and
+    # location by value and IsEqual additionally compares the orientation, all of
+    # which are propagated to the sub shapes. The key holds the shape itself, so
+    # nothing it refers to can be freed and reused while it is cached.
+    __slots__ = ("shape", "hash")
 
-    for i in range(1, extent_or_size(compound_map) + 1):
-        yield TopoDS.Compound_s(compound_map.FindKey(i))
+    def __init__(self, shape):
+        self.shape = shape
+        self.hash = hash_compat(shape)
 
+    def __hash__(self):
+        return self.hash
 
-def get_solids(shape):
-    solid_map = TopTools_IndexedMapOfShape()
-    TopExp.MapShapes_s(shape, TopAbs_SOLID, solid_map)
+    def __eq__(self, other):
+        return self.hash == other.hash and self.shape.IsEqual(other.shape)
 
-    for i in range(1, extent_or_size(solid_map) + 1):
-        yield TopoDS.Solid_s(solid_map.FindKey(i))
 
+@cached(LRUCache(maxsize=128), key=lambda shape, kind: (_TopologyKey(shape), kind))
+def _get_map(shape, kind):
+    shape_map = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape, kind, shape_map)
+    return shape_map
 
-def get_faces(shape):
-    face_map = TopTools_IndexedMapOfShape()
-    TopExp.MapShapes_s(shape, TopAbs_FACE, face_map)
 
-    for i in range(1, extent_or_size(face_map) + 1):
-        yield TopoDS.Face_s(face_map.FindKey(i))
+def _iter_map(shape, kind, cast):
+    shape_map = _get_map(shape, kind)
+    find_key = shape_map.FindKey
+    for i in range(1, extent_or_size(shape_map) + 1):
+        yield cast(find_key(i))
 
 
-def get_wires(shape):
-    wire_map = TopTools_IndexedMapOfShape()
-    TopExp.MapShapes_s(shape, TopAbs_WIRE, wire_map)
+def get_compounds(shape):
+    return _iter_map(shape, TopAbs_COMPOUND, TopoDS.Compound_s)
+
 
-    for i in range(1, extent_or_size(wire_map) + 1):
-        yield TopoDS.Wire_s(wire_map.FindKey(i))
+def get_solids(shape):
+    return _iter_map(shape, TopAbs_SOLID, TopoDS.Solid_s)
 
 
-def get_edges(shape, with_face=False):
-    edge_map = TopTools_IndexedMapOfShape()
-    TopExp.MapShapes_s(shape, TopAbs_EDGE, edge_map)
+def get_faces(shape):
+    return _iter_map(shape, TopAbs_FACE, TopoDS.Face_s)
 
-    if with_face:
-        face_map = TopTools_IndexedDataMapOfShapeListOfShape()
-        TopExp.MapShapesAndAncestors_s(shape, TopAbs_EDGE, TopAbs_FACE, face_map)
 
-    for i in range(1, extent_or_size(edge_map) + 1):
-        edge = TopoDS.Edge_s(edge_map.FindKey(i))
+def get_wires(shape):
+    return _iter_map(shape, TopAbs_WIRE, TopoDS.Wire_s)
 
-        if with_face:
-            face_list = face_map.FindFromKey(edge)
-            if extent_or_size(face_list) == 0:
-                # print("no faces")
-                continue
 
-            yield edge, TopoDS.Face_s(face_list.First())
-        else:
-            yield edge
+@cached(LRUCache(maxsize=256), key=_TopologyKey)
+def _edge_face_map(shape):
+    face_map = TopTools_IndexedDataMapOfShapeListOfShape()
+    TopExp.MapShapesAndAncestors_s(shape, TopAbs_EDGE, TopAbs_FACE, face_map)
+    return face_map
 
 
-def get_vertices(shape):
-    vertex_map = TopTools_IndexedMapOfShape()
-    TopExp.MapShapes_s(shape, TopAbs_VERTEX, vertex_map)
+def get_edges(shape, with_face=False):
+    if not with_face:
+        yield from _iter_map(shape, TopAbs_EDGE, TopoDS.Edge_s)
+        return
+
+    edge_map = _get_map(shape, TopAbs_EDGE)
+    face_map = _edge_face_map(shape)
+    find_key = edge_map.FindKey
+    find_faces = face_map.FindFromKey
+    for i in range(1, extent_or_size(edge_map) + 1):
+        edge = TopoDS.Edge_s(find_key(i))
+        face_list = find_faces(edge)
+        if extent_or_size(face_list) == 0:
+            # print("no faces")
+            continue
 
-    for i in range(1, extent_or_size(vertex_map) + 1):
-        yield TopoDS.Vertex_s(vertex_map.FindKey(i))
+        yield edge, TopoDS.Face_s(face_list.First())
+
+
+def get_vertices(shape):
+    return _iter_map(shape, TopAbs_VERTEX, TopoDS.Vertex_s)
 
 
 def get_downcasted_shape(shape):
@@ -505,7 +573,8 @@ def get_downcasted_shape(shape):
     else:
         return []
 
-    return [downcast(obj) for obj in objs]
+    # the get_* iterators already downcast to the type of their map
+    return list(objs)
 
 
 def get_point(vertex):
@@ -514,91 +583,140 @@ def get_point(vertex):
 
 
 def get_tuple(obj):
-    if hasattr(obj, "to_tuple"):
-        return obj.to_tuple()
-    elif hasattr(obj, "toTuple"):
-        return obj.toTuple()
-    else:
+    to_tuple = getattr(obj, "to_tuple", _MISSING)
+    if to_tuple is _MISSING:
+        to_tuple = getattr(obj, "toTuple", _MISSING)
+    if to_tuple is _MISSING:
         raise RuntimeError(f"Cannot convert {type(obj)} to tuple")
+    return to_tuple()
 
 
-def get_rgba(color, alpha=None, def_color=None):
-    if color is None:
-        if def_color is None:
-            return None
-        color = def_color
+def _rgba_from_color(color, alpha, def_color):
+    return color
 
+
+def _rgba_from_ocp(color, alpha, def_color):
+    ocp_rgb = color.GetRGB()
+    return Color(
+        (
+            ocp_rgb.Red(),
+            ocp_rgb.Green(),
+            ocp_rgb.Blue(),
+            color.Alpha() if alpha is None else alpha,
+        )
+    )
+
+
+def _rgba_from_value(color, alpha, def_color):
+    return Color(color, 1.0 if alpha is None else alpha)
+
+
+def _rgba_from_wrapped(color, alpha, def_color):  # CadQery or build123d Color
+    return get_rgba(color.wrapped, alpha, def_color)
+
+
+# handler per color class, other classes are added on first sight
+_RGBA_DISPATCH = {
+    Color: _rgba_from_color,
+    Quantity_ColorRGBA: _rgba_from_ocp,
+    str: _rgba_from_value,
+    tuple: _rgba_from_value,
+    list: _rgba_from_value,
+}
+
+
+def _detect_rgba_handler(color):
     if isinstance(color, Color):
-        return color
+        return _rgba_from_color
 
-    if hasattr(color, "wrapped"):  # CadQery or build123d Color
-        rgba = get_rgba(color.wrapped, alpha, def_color)
+    elif hasattr(color, "wrapped"):
+        return _rgba_from_wrapped
 
     elif isinstance(color, Quantity_ColorRGBA):  # OCP
-        ocp_rgb = color.GetRGB()
-        rgba = Color(
-            (
-                ocp_rgb.Red(),
-                ocp_rgb.Green(),
-                ocp_rgb.Blue(),
-                color.Alpha() if alpha is None else alpha,
-            )
-        )
+        return _rgba_from_ocp
 
-    elif isinstance(color, str) or isinstance(color, (tuple, list)):
-        rgba = Color(color, 1.0 if alpha is None else alpha)
+    elif isinstance(color, (str, tuple, list)):
+        return _rgba_from_value
 
     else:
         raise ValueError(f"Unknown color input {color} ({type(color)}")
 
-    return rgba
+
+def get_rgba(color, alpha=None, def_color=None):
+    if color is None:
+        if def_color is None:
+            return None
+        color = def_color
+
+    handler = _RGBA_DISPATCH.get(type(color))
+    if handler is None:
+        handler = _detect_rgba_handler(color)
+        _RGBA_DISPATCH[type(color)] = handler
+
+    return handler(color, alpha, def_color)
 
 
 def list_topods_compound(compound):
     iterator = TopoDS_Iterator(compound)
-    while iterator.More():
-        yield downcast(iterator.Value())
-        iterator.Next()
+    more, value, next_ = iterator.More, iterator.Value, iterator.Next
+    dc = downcast
+    while more():
+        yield dc(value())
+        next_()
 
 
 def unroll_compound(compound, typ=None):
     result = []
-    for o in compound:
-        if is_compound(o):
-            unrolled, typ = unroll_compound(o, typ)
-            if len(unrolled) == 1:
-                result.append(unrolled[0])
-            else:
-                result.append(unrolled)
+    # explicit stack of (list, iterator, parent list, index in parent) frames
+    stack = [(result, iter(compound), None, None)]
+    pop, push = stack.pop, stack.append
+    is_compound_, dc, tname = is_compound, downcast, type_name
+    while stack:
+        current, iterator, parent, index = stack[-1]
+        o = next(iterator, None)
+        if o is None:
+            pop()
+            if parent is not None and len(current) == 1:
+                parent[index] = current[0]
+        elif is_compound_(o):
+            unrolled = []
+            current.append(unrolled)
+            push((unrolled, iter(o), current, len(current) - 1))
         else:
-            result.append(downcast(o.wrapped))
+            obj = o.wrapped
+            current.append(dc(obj))
+            obj_typ = tname(obj)
             if typ is None:
-                typ = type_name(o.wrapped)
-            elif typ != type_name(o.wrapped):
+                typ = obj_typ
+            elif typ != obj_typ:
                 typ = "mixed"
     return result, typ
 
 
 def unroll_topods_compound(compound, typ=None):
     result = []
-
-    iterator = TopoDS_Iterator(compound)
-    while iterator.More():
-        obj = downcast(iterator.Value())
-
-        if is_topods_compound(obj):
-            unrolled, typ = unroll_topods_compound(obj, typ)
-            if len(unrolled) == 1:
-                result.append(unrolled[0])
-            else:
-                result.append(unrolled)
+    # explicit stack of (list, iterator, parent list, index in parent) frames
+    stack = [(result, list_topods_compound(compound), None, None)]
+    pop, push = stack.pop, stack.append
+    is_compound_, tname = is_topods_compound, type_name
+    while stack:
+        current, iterator, parent, index = stack[-1]
+        obj = next(iterator, None)
+        if obj is None:
+            pop()
+            if parent is not None and len(current) == 1:
+                parent[index] = current[0]
+        elif is_compound_(obj):
+            unrolled = []
+            current.append(unrolled)
+            push((unrolled, list_topods_compound(obj), current, len(current) - 1))
         else:
-            result.append(downcast(obj))
+            current.append(obj)
+            obj_typ = tname(obj)
             if typ is None:
-                typ = type_name(obj)
-            elif typ != type_name(obj):
+                typ = obj_typ
+            elif typ != obj_typ:
                 typ = "mixed"
-        iterator.Next()
     return result, typ
 
 
@@ -741,7 +859,17 @@ def loc_to_tq(loc):
 
 
 def identity_location():
-    return TopLoc_Location(gp_Trsf())
+    # always a new instance: OCCT calls like BRep_Tool.Triangulation_s(face, loc)
+    # write into the location they are given
+    return TopLoc_Location()
+
+
+def trsf_to_matrix(trsf):
+    # (3, 4) matrix [R | t] of a gp_Trsf, R includes the scale factor
+    return np.array(
+        [[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)],
+        dtype=np.float64,
+    )
 
 
 def relocate(obj):
@@ -763,30 +891,28 @@ def get_location(obj, as_none=True):
     if obj is None:
         return None if as_none else identity_location()
     else:
-        if hasattr(obj, "loc") and obj.loc is not None:
-            loc = obj.loc
-
-        elif hasattr(obj, "location"):
-            loc = obj.location
-            if callable(loc):
-                loc = loc()
-
-        elif hasattr(obj, "to_location"):
-            loc = obj.location
-            if callable(loc):
-                loc = loc()
+        loc = getattr(obj, "loc", None)
+        if loc is None:
+            loc = getattr(obj, "location", _MISSING)
+            if loc is _MISSING and hasattr(obj, "to_location"):
+                loc = obj.location
+
+            if loc is not _MISSING:
+                if callable(loc):
+                    loc = loc()
+            else:
+                wrapped_loc = getattr(getattr(obj, "wrapped", None), "Location", None)
+                if wrapped_loc is not None:
+                    return wrapped_loc()
 
-        elif is_wrapped(obj) and hasattr(obj.wrapped, "Location"):
-            return obj.wrapped.Location()
+                elif isinstance(obj, TopLoc_Location):
+                    return obj
 
-        elif isinstance(obj, TopLoc_Location):
-            return obj
+                elif is_topods_shape(obj):
+                    loc = obj.Location()
 
-        elif is_topods_shape(obj):
-            loc = obj.Location()
-
-        else:
-            return None if as_none else identity_location()
+                else:
+                    return None if as_none else identity_location()
 
     if hasattr(loc, "wrapped"):
         return loc.wrapped
@@ -913,52 +1039,90 @@ def is_plane_xy(obj):
 # Caching helpers for bounding box
 
 
+def _shape_key(obj):
+    if hasattr(obj, "TShape"):
+        tshape = obj.TShape()
+        # keep the TShape handle and the shape itself in the key to pin both, so
+        # that their ids cannot be reused by another shape (e.g. a moved copy
+        # sharing the TShape) while the key is alive in the cache
+        return (id(tshape), tshape, id(obj), obj)
+    else:
+        return (hash_compat(obj), id(obj))
+
+
 def make_key(objs, loc=None, optimal=False):  # pylint: disable=unused-argument
     # optimal is not used and as such ignored
     if not isinstance(objs, (tuple, list)):
         objs = [objs]
 
-    key = (tuple(((hash_compat(s), id(s)) for s in objs)), loc_to_tq(loc))
+    key = (tuple(map(_shape_key, objs)), loc_to_tq(loc))
     return key
 
 
-def get_size(obj):
-    size = sys.getsizeof(obj)
-    if isinstance(obj, dict):
-        size += sum([get_size(v) + len(k) for k, v in obj.items()])
-    elif isinstance(obj, (tuple, list)):
-        size += sum([get_size(i) for i in obj])
-    return size
+# BoundingBox objects have a fixed size, so the cache is sized in entries
+cache = LRUCache(maxsize=16 * 1024)
+
 
+def _bb_property(bound, index):
+    def getter(self):
+        return float(getattr(self, bound)[index])
 
-cache = LRUCache(maxsize=16 * 1024 * 1024, getsizeof=get_size)
+    def setter(self, value):
+        getattr(self, bound)[index] = value
+        self._corners = None
+
+    return property(getter, setter)
 
 
 class BoundingBox(object):
+    __slots__ = (
+        "optimal",
+        "_lo",
+        "_hi",
+        "xsize",
+        "ysize",
+        "zsize",
+        "center",
+        "max",
+        "_corners",
+    )
+
+    xmin = _bb_property("_lo", 0)
+    ymin = _bb_property("_lo", 1)
+    zmin = _bb_property("_lo", 2)
+    xmax = _bb_property("_hi", 0)
+    ymax = _bb_property("_hi", 1)
+    zmax = _bb_property("_hi", 2)
+
     def __init__(self, obj=None, optimal=False):
         self.optimal = optimal
         if obj is None:
-            self.xmin = self.xmax = self.ymin = self.ymax = self.zmin = self.zmax = 0
+            self._lo = np.zeros(3)
+            self._hi = np.zeros(3)
         elif isinstance(obj, BoundingBox):
-            self.xmin = obj.xmin
-            self.xmax = obj.xmax
-            self.ymin = obj.ymin
-            self.ymax = obj.ymax
-            self.zmin = obj.zmin
-            self.zmax = obj.zmax
+            self._lo = obj._lo.copy()
+            self._hi = obj._hi.copy()
         elif isinstance(obj, dict):
-            self.xmin = obj["xmin"]
-            self.xmax = obj["xmax"]
-            self.ymin = obj["ymin"]
-            self.ymax = obj["ymax"]
-            self.zmin = obj["zmin"]
-            self.zmax = obj["zmax"]
+            self._lo, self._hi = self._from_dict(obj)
         else:
-            bbox = self._bounding_box(obj)
-            self.xmin, self.xmax, self.ymin, self.ymax, self.zmin, self.zmax = bbox
+            xmin, xmax, ymin, ymax, zmin, zmax = self._bounding_box(obj)
+            self._lo = np.array((xmin, ymin, zmin), dtype=float)
+            self._hi = np.array((xmax, ymax, zmax), dtype=float)
 
         self._calc()
 
+    @classmethod
+    def from_compound(cls, objs, optimal=False):
+        # one Bnd_Box pass over a compound instead of one box per shape
+        return cls(make_compound(list(objs)), optimal=optimal)
+
+    @staticmethod
+    def _from_dict(bb):
+        return (
+            np.array((bb["xmin"], bb["ymin"], bb["zmin"]), dtype=float),
+            np.array((bb["xmax"], bb["ymax"], bb["zmax"]), dtype=float),
+        )
+
     def _center_of_mass(self, obj):
         return center_of_mass(obj)
 
@@ -986,89 +1150,56 @@ class BoundingBox(object):
             return bb
 
     def _calc(self):
-        self.xsize = self.xmax - self.xmin
-        self.ysize = self.ymax - self.ymin
-        self.zsize = self.zmax - self.zmin
-        self.center = (
-            self.xmin + self.xsize / 2.0,
-            self.ymin + self.ysize / 2.0,
-            self.zmin + self.zsize / 2.0,
-        )
-        self.max = max(
-            [
-                abs(x)
-                for x in (
-                    self.xmin,
-                    self.xmax,
-                    self.ymin,
-                    self.ymax,
-                    self.zmin,
-                    self.zmax,
-                )
-            ]
-        )
+        self._corners = None
+        size = self._hi - self._lo
+        self.xsize, self.ysize, self.zsize = size.tolist()
+        self.center = tuple(((self._lo + self._hi) * 0.5).tolist())
+        self.max = float(np.abs(np.concatenate((self._lo, self._hi))).max())
 
     def is_empty(self):
-        return (
-            (abs(self.xmax - self.xmin) < 0.01)
-            and (abs(self.ymax - self.ymin) < 0.01)
-            and (abs(self.zmax - self.zmin) < 0.01)
-        )
+        return bool((np.abs(self._hi - self._lo) < 0.01).all())
+
+    def _get_corners(self):
+        if self._corners is None:
+            bounds = np.stack((self._lo, self._hi), axis=1)
+            self._corners = np.array(np.meshgrid(*bounds)).reshape(3, -1).T
+        return self._corners
 
     def max_dist_from_center(self):
-        return max(
-            [
-                distance(self.center, v)
-                for v in itertools.product(
-                    (self.xmin, self.xmax),
-                    (self.ymin, self.ymax),
-                    (self.zmin, self.zmax),
-                )
-            ]
-        )
+        corners = self._get_corners() - np.asarray(self.center, dtype=float)
+        return float(np.linalg.norm(corners, axis=1).max())
 
     def max_dist_from_origin(self):
-        return max(
-            [
-                np.linalg.norm(v)
-                for v in itertools.product(
-                    (self.xmin, self.xmax),
-                    (self.ymin, self.ymax),
-                    (self.zmin, self.zmax),
-                )
-            ]
-        )
+        # The farthest corner maximizes every squared coordinate independently,
+        # so no corner enumeration is needed and only one sqrt is taken
+        lo, hi = self._lo, self._hi
+        return float(np.sqrt(np.maximum(lo * lo, hi * hi).sum()))
 
     def update(self, bb, minimize=False):
-        lower, upper = (max, min) if minimize else (min, max)
-
         if isinstance(bb, BoundingBox):
-            self.xmin = lower(bb.xmin, self.xmin)
-            self.xmax = upper(bb.xmax, self.xmax)
-            self.ymin = lower(bb.ymin, self.ymin)
-            self.ymax = upper(bb.ymax, self.ymax)
-            self.zmin = lower(bb.zmin, self.zmin)
-            self.zmax = upper(bb.zmax, self.zmax)
+            lo, hi = bb._lo, bb._hi
         elif isinstance(bb, dict):
-            self.xmin = lower(bb["xmin"], self.xmin)
-            self.xmax = upper(bb["xmax"], self.xmax)
-            self.ymin = lower(bb["ymin"], self.ymin)
-            self.ymax = upper(bb["ymax"], self.ymax)
-            self.zmin = lower(bb["zmin"], self.zmin)
-            self.zmax = upper(bb["zmax"], self.zmax)
+            lo, hi = self._from_dict(bb)
         else:
             raise "Wrong bounding box param"
 
+        if minimize:
+            np.maximum(self._lo, lo, out=self._lo)
+            np.minimum(self._hi, hi, out=self._hi)
+        else:
+            np.minimum(self._lo, lo, out=self._lo)
+            np.maximum(self._hi, hi, out=self._hi)
+
         self._calc()
 
     def to_dict(self):
         return {
-            "xmin": float(self.xmin),
-            "xmax": float(self.xmax),
-            "ymin": float(self.ymin),
-            "ymax": float(self.ymax),
-            "zmin": float(self.zmin),
-            "zmax": float(self.zmax),
+            "xmin": self.xmin,
+            "xmax": self.xmax,
+            "ymin": self.ymin,
+            "ymax": self.ymax,
+            "zmin": self.zmin,
+            "zmax": self.zmax,
         }
 
     def __repr__(self):
@@ -1099,7 +1230,7 @@ def bounding_box(objs, loc=None, optimal=False):
 #
 
 
-def rotate(q, v):
+def rotation_matrix(q):
     x, y, z, w = q
     x2 = 2 * x * x
     y2 = 2 * y * y
@@ -1111,29 +1242,64 @@ def rotate(q, v):
     yw = 2 * y * w
     zw = 2 * z * w
 
-    R = np.array(
+    return np.array(
         [
             [1 - y2 - z2, xy - zw, xz + yw],
             [xy + zw, 1 - x2 - z2, yz - xw],
             [xz - yw, yz + xw, 1 - x2 - y2],
         ]
     )
-    return np.dot(v, R.T)
+
+
+def rotate(q, v):
+    return np.dot(v, rotation_matrix(q).T)
+
+
+def is_identity_quaternion(q, tol=1e-12):
+    return q is None or (
+        abs(q[0]) < tol
+        and abs(q[1]) < tol
+        and abs(q[2]) < tol
+        and abs(abs(q[3]) - 1) < tol
+    )
+
+
+# rows per block: a block stays cache resident, so the min and the max pass
+# (and the rotation) read each vertex only once from main memory
+NP_BBOX_CHUNK = 16384
+
+
+def _chunked_minmax(n_p, r_t=None):
+    bbmin = np.full(3, np.inf)
+    bbmax = np.full(3, -np.inf)
+    for i in range(0, n_p.shape[0], NP_BBOX_CHUNK):
+        v = n_p[i : i + NP_BBOX_CHUNK]
+        if r_t is not None:
+            v = v @ r_t
+        np.minimum(bbmin, v.min(axis=0), out=bbmin)
+        np.maximum(bbmax, v.max(axis=0), out=bbmax)
+    return bbmin, bbmax
 
 
 def np_bbox(p, t, q):
     if p.size == 0:
         return None
 
-    n_p = p.reshape(-1, 3)
-    if t is None and q is None:
-        v = n_p
+    # keep display precision (float32) meshes in float32, half the bytes to touch
+    dt = p.dtype if p.dtype in (np.float32, np.float64) else np.float32
+    n_p = p.reshape(-1, 3).astype(dt, copy=False)
+    if is_identity_quaternion(q):
+        # no rotation: translation only shifts the bounds
+        bbmin, bbmax = _chunked_minmax(n_p)
     else:
-        n_t = np.asarray(t)
-        v = rotate(q, n_p) + n_t
+        bbmin, bbmax = _chunked_minmax(n_p, rotation_matrix(q).T.astype(dt))
+
+    # translation doesn't change the extent, add it to the bounds only
+    if t is not None:
+        n_t = np.asarray(t, dtype=np.float64)
+        bbmin += n_t
+        bbmax += n_t
 
-    bbmin = np.min(v, axis=0)
-    bbmax = np.max(v, axis=0)
     return {
         "xmin": bbmin[0],
         "xmax": bbmax[0],
@@ -1157,16 +1323,36 @@ def length(edge_or_wire):
 # TODO replace with https://github.com/MatthiasJ1/ocp_serializer when published
 
 
+def _bintools_supports_bytesio():
+    try:
+        compound = TopoDS_Compound()
+        TopoDS_Builder().MakeCompound(compound)
+        bio = io.BytesIO()
+        BinTools.Write_s(compound, bio, False, False, BinTools_FormatVersion_CURRENT)
+        BinTools.Read_s(TopoDS_Shape(), io.BytesIO(bio.getvalue()))
+        return True
+    except Exception:
+        return False
+
+
+_BINTOOLS_SUPPORTS_BYTESIO = _bintools_supports_bytesio()
+
+# fallback only: keep the temporary brep files in RAM where possible (Linux)
+_SERIALIZE_TMP_DIR = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+
 def serialize(shape, triangles=False, normals=False):
     if shape is None:
         return None
 
-    try:
+    if _BINTOOLS_SUPPORTS_BYTESIO:
         bio = io.BytesIO()
         BinTools.Write_s(shape, bio, triangles, normals, BinTools_FormatVersion_CURRENT)
         buffer = bio.getvalue()
-    except Exception:
-        with tempfile.TemporaryDirectory() as tmpdirname:
+    else:
+        with tempfile.TemporaryDirectory(dir=_SERIALIZE_TMP_DIR) as tmpdirname:
             filename = os.path.join(tmpdirname, "shape.brep")
             BinTools.Write_s(
                 shape, filename, False, False, BinTools_FormatVersion_CURRENT
@@ -1176,16 +1362,20 @@ def serialize(shape, triangles=False, normals=False):
     return buffer
 
 
+def serialize_many(shapes, triangles=False, normals=False):
+    # one BinTools stream for all shapes, deserialize returns them as compound
+    return serialize(make_compound(shapes), triangles, normals)
+
+
 def deserialize(buffer):
     if buffer is None:
         return None
 
     shape = TopoDS_Shape()
-    try:
-        bio = io.BytesIO(buffer)
-        BinTools.Read_s(shape, bio)
-    except Exception:
-        with tempfile.TemporaryDirectory() as tmpdirname:
+    if _BINTOOLS_SUPPORTS_BYTESIO:
+        BinTools.Read_s(shape, io.BytesIO(buffer))
+    else:
+        with tempfile.TemporaryDirectory(dir=_SERIALIZE_TMP_DIR) as tmpdirname:
             filename = os.path.join(tmpdirname, "shape.brep")
             with open(filename, "wb") as fd:
                 fd.write(buffer)
@@ -36,6 +36,7 @@ from OCP.TDocStd import TDocStd_Document
 from OCP.TopAbs import TopAbs_COMPOUND, TopAbs_COMPSOLID, TopAbs_FACE, TopAbs_SOLID
 from OCP.TopExp import TopExp_Explorer
 from OCP.TopLoc import TopLoc_Location
+from OCP.TopTools import TopTools_MapOfShape
 from OCP.XCAFDoc import (
     XCAFDoc_ColorCurv,
     XCAFDoc_ColorGen,
@@ -133,12 +134,15 @@ class StepReader:
         colors = []
         if self.analyse_faces:
 
-            # Find all face colors
+            # Find all face colors, shared faces are visited only once
+            seen = TopTools_MapOfShape()
             exp = TopExp_Explorer(shape, TopAbs_FACE)
             while exp.More():
-                color = get_col(exp.Current())
-                if color is not None:
-                    colors.append(color)
+                face = exp.Current()
+                if seen.Add(face):
+                    color = get_col(face)
+                    if color is not None:
+                        colors.append(color)
                 exp.Next()
 
             colors = list(set(colors))
@@ -20,7 +20,7 @@ import os
 import sys
 
 import numpy as np
-from cachetools import LRUCache, cached
+from cachetools import LRUCache
 from OCP.BRep import BRep_Tool
 from OCP.BRepAdaptor import BRepAdaptor_Curve
 from OCP.BRepGProp import BRepGProp_Face
@@ -30,11 +30,12 @@ from OCP.GCPnts import GCPnts_QuasiUniformAbscissa, GCPnts_QuasiUniformDeflectio
 
 # pylint: disable=no-name-in-module,import-error
 from OCP.gp import gp_Pnt, gp_Vec
-from OCP.TopAbs import TopAbs_Orientation, TopAbs_SOLID
-from OCP.TopExp import TopExp_Explorer
+from OCP.TopAbs import TopAbs_Orientation
 from OCP.TopLoc import TopLoc_Location
+from OCP.TopTools import TopTools_MapOfShape
 
 from .ocp_utils import (
+    trsf_to_matrix,
     get_edge_type,
     get_edges,
     get_face_type,
@@ -46,7 +47,7 @@ from .ocp_utils import (
     make_compound,
 )
 from .trace import Trace
-from .utils import Timer, round_sig
+from .utils import Timer, round_bits
 
 try:
     from ocp_addons.tessellator import tessellate as tessellate_c
@@ -58,7 +59,10 @@ try:
         os.environ["NATIVE_TESSELLATOR"] = "0"
 
     def is_native_tessellator_enabled():
-        return os.environ.get("NATIVE_TESSELLATOR") == "1"
+        # an unset variable selects the native tessellator, any other value
+        # than "1" the python version
+        v = os.environ.get("NATIVE_TESSELLATOR")
+        return v is None or v == "1"
 
     if os.environ.get("NATIVE_TESSELLATOR") is None:
         enable_native_tessellator()
@@ -91,32 +95,18 @@ def make_key(
     # quality is a measure of bounding box and deviation, hence can be ignored (and should due to accuracy issues
     # shape_id is also ignored
     # of non optimal bounding boxes. debug and progress are also irrelevant for tessellation results)
-    if not isinstance(shape, (tuple, list)):
-        shape = [shape]
-
-    key = (
-        # tuple((cache_key, tuple(s.HashCode(MAX_HASH_KEY) for s in shape))),
-        cache_key,
-        deviation,
-        angular_tolerance,
-        compute_edges,
-        compute_faces,
-    )
-
-    if progress is not None and cache.get(key) is not None:
-        progress.update("c")
-
-    return key
+    # The shape itself is not part of the key: cache_key is derived from the serialized shape, hence
+    # equal shapes created in different runs share their tessellation
+    return (cache_key, deviation, angular_tolerance, compute_edges, compute_faces)
 
 
 def get_size(obj):
+    # tessellation results are flat dicts, mostly of numpy arrays: count the array
+    # buffers and fall back to sys.getsizeof for any other value (e.g. the results
+    # of the native tessellator)
     size = sys.getsizeof(obj)
-    if isinstance(obj, dict):
-        size += sum([get_size(v) + len(k) for k, v in obj.items()])
-    elif isinstance(obj, np.ndarray):
-        size += obj.size * obj.dtype.itemsize
-    elif isinstance(obj, (tuple, list)):
-        size += sum([get_size(i) for i in obj])
+    for v in obj.values():
+        size += v.nbytes if isinstance(v, np.ndarray) else sys.getsizeof(v)
     return size
 
 
@@ -160,27 +150,19 @@ def vertex_mapper(vertices, id):
 class Tessellator:
     def __init__(self, shape_id):
         self.shape_id = shape_id
-        self.triangles = []
+        self.triangles = []  # per face (n, 3) index blocks
         self.triangles_per_face = []
-        self.vertices = []  # triangle vertices
-        self.normals = []
-        self.edges = []
+        self.vertices = []  # triangle vertices, per face (n, 3) blocks
+        self.normals = []  # per face (n, 3) blocks
+        self.edges = []  # per edge blocks of segment start and end points
         self.segments_per_edge = []
 
-        self.obj_vertices = []  # object vertices
+        self.obj_vertices = []  # object vertices as (x, y, z) tuples
         self.face_types = []
         self.edge_types = []
 
         self.shape = None
 
-    def number_solids(self, shape):
-        count = 0
-        e = TopExp_Explorer(shape, TopAbs_SOLID)
-        while e.More():
-            count += 1
-            e.Next()
-        return count
-
     def compute(
         self,
         shape,
@@ -192,7 +174,8 @@ class Tessellator:
     ):
         self.shape = shape
 
-        count = self.number_solids(shape)
+        # faces, edges and vertices below come from the cached sub-shape maps of
+        # ocp_utils (one TopExp.MapShapes pass per kind and shape)
         with Timer(
             debug,
             "",
@@ -217,8 +200,9 @@ class Tessellator:
                 self.compute_edges(trace)
 
         for ind, v in enumerate(get_vertices(shape)):
-            trace.vertex(f"{self.shape_id}/vertices/vertex{ind}", v)
-            self.obj_vertices.extend(get_point(v))
+            if trace.enabled:
+                trace.vertex(f"{self.shape_id}/vertices/vertex{ind}", v)
+            self.obj_vertices.append(get_point(v))
 
         trace.close()
 
@@ -229,92 +213,133 @@ class Tessellator:
         # global buffers
         p_buf = gp_Pnt()
         n_buf = gp_Vec()
-        loc_buf = TopLoc_Location()
 
-        offset = -1
+        # pre-scan the triangulations to size the output buffers, so that every face writes
+        # its rows straight into its slice of one contiguous array
+        faces = []
+        total_nodes = total_triangles = 0
+        for face in get_faces(self.shape):
+            loc = TopLoc_Location()
+            poly = BRep_Tool.Triangulation_s(face, loc)
+            faces.append((face, poly, loc))
+            if poly is not None:
+                total_nodes += poly.NbNodes()
+                total_triangles += poly.NbTriangles()
 
-        # every line below is selected for performance. Do not introduce functions to "beautify" the code
-        for ind, face in enumerate(get_faces(self.shape)):
-            trace.face(f"{self.shape_id}/faces/faces_{ind}", face)
-            if face.Orientation() == TopAbs_Orientation.TopAbs_REVERSED:
-                i1, i2 = 2, 1
-            else:
-                i1, i2 = 1, 2
+        vertices = np.empty((total_nodes, 3), dtype=np.float32)
+        triangles = np.empty((total_triangles, 3), dtype=np.int32)
+        normals = np.empty((total_nodes, 3), dtype=np.float32)
+        has_normals = True
+
+        start = 0  # first row of the face in vertices and normals
+        t_start = 0  # first row of the face in triangles
 
+        # every line below is selected for performance. Do not introduce functions to "beautify" the code
+        # Note: faces are not extracted in a thread pool. The OCP calls below do not release the GIL,
+        # so threads only add overhead. Meshing itself already runs in parallel in BRepMesh.
+        for ind, (face, poly, loc) in enumerate(faces):
+            if trace.enabled:
+                trace.face(f"{self.shape_id}/faces/faces_{ind}", face)
+            is_reversed = face.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
             internal = face.Orientation() == TopAbs_Orientation.TopAbs_INTERNAL
 
             self.face_types.append(get_face_type(face))
 
-            poly = BRep_Tool.Triangulation_s(face, loc_buf)
             if poly is not None:
-                Trsf = loc_buf.Transformation()
-
-                # add vertices
-                flat = []
-                for i in range(1, poly.NbNodes() + 1):
-                    flat.extend(poly.Node(i).Transformed(Trsf).Coord())
-                self.vertices.extend(flat)
-
-                # add triangles
-                flat = []
-                for i in range(1, poly.NbTriangles() + 1):
-                    coord = poly.Triangle(i).Get()
-                    flat.extend(
-                        (coord[0] + offset, coord[i1] + offset, coord[i2] + offset)
-                    )
-                self.triangles.extend(flat)
-                self.triangles_per_face.append(poly.NbTriangles())
+                nb_nodes = poly.NbNodes()
+                nb_triangles = poly.NbTriangles()
+                end = start + nb_nodes
+                t_end = t_start + nb_triangles
+
+                # add vertices: fetch the raw nodes, then transform them in one go
+                node = poly.Node
+                nodes = np.array(
+                    [node(i).Coord() for i in range(1, nb_nodes + 1)],
+                    dtype=np.float64,
+                ).reshape(-1, 3)
+                if not loc.IsIdentity():
+                    # one (3, 4) matrix per face instead of a gp_Trsf call per node
+                    m = trsf_to_matrix(loc.Transformation())
+                    nodes = nodes @ m[:, :3].T + m[:, 3]
+                vertices[start:end] = nodes
+
+                # add triangles (OCCT indices are 1 based and local to the face)
+                triangle = poly.Triangle
+                tris = triangles[t_start:t_end]
+                if nb_triangles > 0:
+                    tris[:] = [triangle(i).Get() for i in range(1, nb_triangles + 1)]
+                    tris += start - 1
+                    if is_reversed:
+                        # flip the winding: (a, b, c) -> (a, c, b)
+                        tris[:, 1:] = tris[:, :0:-1]
+                self.triangles_per_face.append(nb_triangles)
 
                 # add normals
                 if poly.HasUVNodes():
                     prop = BRepGProp_Face(face)
+                    uv_node = poly.UVNode
                     flat = []
-                    for i in range(1, poly.NbNodes() + 1):
-                        u, v = poly.UVNode(i).Coord()
+                    for i in range(1, nb_nodes + 1):
+                        u, v = uv_node(i).Coord()
                         prop.Normal(u, v, p_buf, n_buf)
                         if n_buf.SquareMagnitude() > 0:
                             n_buf.Normalize()
-                        flat.extend(
-                            n_buf.Reverse().Coord() if internal else n_buf.Coord()
-                        )
-                    self.normals.extend(flat)
-
-                offset += poly.NbNodes()
+                        flat.append(n_buf.Coord())
+                    normals[start:end] = flat
+                    if internal:
+                        np.negative(normals[start:end], out=normals[start:end])
+                else:
+                    has_normals = False
+
+                start, t_start = end, t_end
+
+        self.vertices = [vertices]
+        self.triangles = [triangles]
+        # without UV nodes for every face, normals get computed from the triangles
+        self.normals = [normals] if has_normals and total_nodes > 0 else []
+
+    def _concat(self, chunks, dtype):
+        # Attributes are kept as separate (n, 3) arrays per face / edge (SoA).
+        # Join the blocks once and keep the result as the only block, so
+        # repeated get_* calls and the missing normals / edges passes work on
+        # one contiguous (N, 3) array without any reshaping
+        if len(chunks) == 0:
+            return np.empty((0, 3), dtype=dtype)
+        if len(chunks) > 1 or chunks[0].dtype != dtype:
+            chunks[:] = [np.concatenate(chunks).astype(dtype, copy=False)]
+        return chunks[0]
 
     def _compute_missing_normals(self):
-        vertices = np.asarray(self.vertices).reshape(-1, 3)
-        triangles = np.asarray(self.triangles).reshape(-1, 3)
-        self.normals = np.zeros(len(self.vertices)).reshape(-1, 3)
-        for triangle in triangles:
-            c = vertices[triangle]
-            v1 = c[2] - c[1]
-            v2 = c[0] - c[1]
-            n = np.cross(v1, v2)
-
-            # extrpolate vertex normal by blending all face normals of a vertex
-            for i in triangle:
-                self.normals[i] += n
-
-        # and normalize later
-        for i in range(len(self.normals)):
-            norm = np.linalg.norm(self.normals[i])
-            self.normals[i] /= norm
-        self.normals = self.normals.ravel()
+        vertices = self._concat(self.vertices, np.float32).astype(np.float64)
+        triangles = self._concat(self.triangles, np.int32)
+
+        # one face normal per triangle ...
+        c = vertices[triangles]
+        n = np.cross(c[:, 2] - c[:, 1], c[:, 0] - c[:, 1])
+
+        # ... and extrapolate vertex normals by blending all face normals of a vertex
+        normals = np.zeros_like(vertices)
+        for k in range(3):
+            np.add.at(normals, triangles[:, k], n)
+
+        norm = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, norm, out=normals, where=norm > 0)
+        self.normals = [normals.astype(np.float32)]
 
     def _compute_missing_edges(self):
-        vertices = np.asarray(self.vertices).reshape(-1, 3)
-        triangles = np.asarray(self.triangles).reshape(-1, 3)
-        for triangle in triangles:
-            c = vertices[triangle]
-            self.edges.extend([(c[0], c[1]), (c[1], c[2]), (c[2], c[0])])
+        vertices = self._concat(self.vertices, np.float32)
+        triangles = self._concat(self.triangles, np.int32)
+        # the three segments (c0, c1), (c1, c2), (c2, c0) of every triangle
+        c = vertices[triangles[:, (0, 1, 1, 2, 2, 0)]]
+        self.edges.append(c.reshape(-1, 2, 3))
 
     def compute_edges(self, trace):
+        loc = TopLoc_Location()  # reused, Triangulation_s overwrites it per face
         for ind, (edge, face) in enumerate(get_edges(self.shape, True)):
-            trace.edge(f"{self.shape_id}/edges/edges_{ind}", edge)
+            if trace.enabled:
+                trace.edge(f"{self.shape_id}/edges/edges_{ind}", edge)
             self.edge_types.append(get_edge_type(edge))
 
-            edges = []
-            loc = TopLoc_Location()
             triangle = BRep_Tool.Triangulation_s(face, loc)
             poly = BRep_Tool.PolygonOnTriangulation_s(edge, triangle, loc)
 
@@ -329,24 +354,28 @@ class Tessellator:
                 nrange = range(indices.Lower(), indices.Upper() + 1)
                 index = indices.Value
 
-            transf = loc.Transformation()
-            v1 = None
-            for j in nrange:
-                v2 = triangle.Node(index(j)).Transformed(transf).Coord()
-                if v1 is not None:
-                    edges.extend((v1, v2))
-                v1 = v2
-            self.edges.extend(edges)
+            node = triangle.Node
+            points = np.array(
+                [node(index(j)).Coord() for j in nrange], dtype=np.float64
+            ).reshape(-1, 3)
+            if not loc.IsIdentity():
+                m = trsf_to_matrix(loc.Transformation())
+                points = points @ m[:, :3].T + m[:, 3]
+            points = points.astype(np.float32)
+
+            # polyline p0, p1, ..., pn to segments (p0, p1), (p1, p2), ...
+            edges = np.stack((points[:-1], points[1:]), axis=1).reshape(-1, 3)
+            self.edges.append(edges)
             self.segments_per_edge.append(len(edges) // 2)
 
         if len(self.edges) == 0:
             self._compute_missing_edges()
 
     def get_vertices(self):
-        return np.asarray(self.vertices, dtype=np.float32)
+        return self._concat(self.vertices, np.float32).ravel()
 
     def get_triangles(self):
-        return np.asarray(self.triangles, dtype=np.int32)
+        return self._concat(self.triangles, np.int32).ravel()
 
     def get_triangles_per_face(self):
         return np.asarray(self.triangles_per_face, dtype=np.int32)
@@ -360,16 +389,18 @@ class Tessellator:
     def get_normals(self):
         if len(self.normals) == 0:
             self._compute_missing_normals()
-        return np.asarray(self.normals, dtype=np.float32)
+        return self._concat(self.normals, np.float32).ravel()
 
     def get_edges(self):
-        return np.asarray(self.edges, dtype=np.float32)
+        if len(self.edges) == 0:
+            return np.empty(0, dtype=np.float32)
+        return self._concat(self.edges, np.float32)
 
     def get_segments_per_edge(self):
         return np.asarray(self.segments_per_edge, dtype=np.int32)
 
     def get_obj_vertices(self):
-        return np.asarray(self.obj_vertices, dtype=np.float32)
+        return np.asarray(self.obj_vertices, dtype=np.float32).ravel()
 
 
 class NativeTessellator:
@@ -427,17 +458,10 @@ class NativeTessellator:
 
 def compute_quality(bb, deviation=0.1):
     # Since tessellation caching depends on quality, try to come up with stable a quality value
-    quality = round_sig(
-        (round_sig(bb.xsize, 3) + round_sig(bb.ysize, 3) + round_sig(bb.zsize, 3))
-        / 300
-        * deviation,
-        3,
-    )
-    return quality
+    return round_bits((bb.xsize + bb.ysize + bb.zsize) / 300 * deviation, 10)
 
 
-# cache key: (shape.hash, cache_key, deviaton, angular_tolerance, compute_edges, compute_faces)
-@cached(cache, key=make_key)
+# cache key: (cache_key, deviaton, angular_tolerance, compute_edges, compute_faces)
 def tessellate(
     shape,
     cache_key,
@@ -450,6 +474,49 @@ def tessellate(
     debug=False,
     progress=None,
     shape_id="",
+):
+    # a single cache lookup that also reports cache hits to progress
+    key = make_key(
+        shape,
+        cache_key,
+        deviation,
+        quality,
+        angular_tolerance,
+        compute_edges=compute_edges,
+        compute_faces=compute_faces,
+    )
+    result = cache.get(key)
+    if result is not None:
+        if progress is not None:
+            progress.update("c")
+        return result
+
+    result = _tessellate(
+        shape,
+        quality,
+        angular_tolerance,
+        compute_faces,
+        compute_edges,
+        debug,
+        progress,
+        shape_id,
+    )
+    try:
+        cache[key] = result
+    except ValueError:
+        pass  # value too large for the cache
+    return result
+
+
+def _tessellate(
+    shape,
+    quality,
+    angular_tolerance,
+    compute_faces,
+    compute_edges,
+    debug,
+    progress,
+    shape_id,
 ):
     if isinstance(shape, (list, tuple)):
         if len(shape) == 1:
@@ -504,29 +571,28 @@ def discretize_edge(edge, deflection=0.1, num=None):
     if not discretizer.IsDone():
         raise AssertionError("Discretizer not done.")
 
-    points = [
-        curve_adaptator.Value(discretizer.Parameter(i)).Coord()
-        for i in range(1, discretizer.NbPoints() + 1)
-    ]
-
-    # return tuples representing the single lines of the egde
-    edges = []
-    for i in range(len(points) - 1):
-        edges.append((points[i], points[i + 1]))
+    value, parameter = curve_adaptator.Value, discretizer.Parameter
+    points = np.array(
+        [value(parameter(i)).Coord() for i in range(1, discretizer.NbPoints() + 1)],
+        dtype=np.float32,
+    ).reshape(-1, 3)
 
-    return np.asarray(edges, dtype=np.float32)
+    # return (n, 2, 3) pairs representing the single lines of the egde
+    return np.stack((points[:-1], points[1:]), axis=1)
 
 
 def discretize_edges(edges, deflection=0.1, shape_id=""):
     d_edges = []
     segments_per_edge = []
     vertices = []
+    seen = TopTools_MapOfShape()
     edge_types = []
 
     trace = Trace(LOG_FILE)
 
     for ind, edge in enumerate(edges):
-        trace.edge(f"{shape_id}/edges/edges_{ind}", edge)
+        if trace.enabled:
+            trace.edge(f"{shape_id}/edges/edges_{ind}", edge)
         edge_types.append(get_edge_type(edge))
 
         d = discretize_edge(edge, deflection)
@@ -534,21 +600,22 @@ def discretize_edges(edges, deflection=0.1, shape_id=""):
             num = int((length(edge) / 2000) / deflection)
             d = discretize_edge(edge, deflection=deflection, num=num)
 
-        d_edges.extend(d.flatten())
+        d_edges.append(d.ravel())
         segments_per_edge.append(len(d))
 
         for v in get_vertices(edge):
-            if v not in vertices:  # ignore duplicates
+            if seen.Add(v):  # ignore duplicates (shared by adjacent edges)
                 vertices.append(v)
 
     d_vertices = []
     for ind, v in enumerate(vertices):
-        trace.vertex(f"{shape_id}/vertices/vertex{ind}", v)
+        if trace.enabled:
+            trace.vertex(f"{shape_id}/vertices/vertex{ind}", v)
         d_vertices.extend(get_point(v))
 
     trace.close()
     return {
-        "edges": np.asarray(d_edges, dtype="float32"),
+        "edges": (np.concatenate(d_edges) if d_edges else np.empty(0, dtype="float32")),
         "segments_per_edge": np.asarray(segments_per_edge, dtype="int32"),
         "edge_types": np.asarray(edge_types, dtype="int32"),
         "obj_vertices": np.asarray(d_vertices, dtype="float32"),
@@ -561,7 +628,8 @@ def convert_vertices(vertices, shape_id=""):
     trace = Trace(LOG_FILE)
 
     for ind, vertex in enumerate(vertices):
-        trace.vertex(f"{shape_id}/vertices/vertex{ind}", vertex)
+        if trace.enabled:
+            trace.vertex(f"{shape_id}/vertices/vertex{ind}", vertex)
         n_vertices.extend(get_point(vertex))
 
     trace.close()
@@ -569,81 +637,32 @@ def convert_vertices(vertices, shape_id=""):
     return {"obj_vertices": np.asarray(n_vertices, dtype="float32")}
 
 
+# corners of the 12 bounding box edges, 0 selects the min and 1 the max value per axis
+_BBOX_EDGES = np.array(
+    [
+        [[1, 1, 0], [1, 1, 1]],
+        [[1, 0, 1], [1, 1, 1]],
+        [[1, 0, 0], [1, 1, 0]],
+        [[1, 0, 0], [1, 0, 1]],
+        [[0, 1, 1], [1, 1, 1]],
+        [[0, 1, 0], [1, 1, 0]],
+        [[0, 1, 0], [0, 1, 1]],
+        [[0, 0, 1], [1, 0, 1]],
+        [[0, 0, 1], [0, 1, 1]],
+        [[0, 0, 0], [1, 0, 0]],
+        [[0, 0, 0], [0, 1, 0]],
+        [[0, 0, 0], [0, 0, 1]],
+    ],
+    dtype=np.intp,
+).reshape(-1, 3)
+
+
 def bbox_edges(bb):
-    return np.asarray(
+    bounds = np.array(
         [
-            bb["xmax"],
-            bb["ymax"],
-            bb["zmin"],
-            bb["xmax"],
-            bb["ymax"],
-            bb["zmax"],
-            bb["xmax"],
-            bb["ymin"],
-            bb["zmax"],
-            bb["xmax"],
-            bb["ymax"],
-            bb["zmax"],
-            bb["xmax"],
-            bb["ymin"],
-            bb["zmin"],
-            bb["xmax"],
-            bb["ymax"],
-            bb["zmin"],
-            bb["xmax"],
-            bb["ymin"],
-            bb["zmin"],
-            bb["xmax"],
-            bb["ymin"],
-            bb["zmax"],
-            bb["xmin"],
-            bb["ymax"],
-            bb["zmax"],
-            bb["xmax"],
-            bb["ymax"],
-            bb["zmax"],
-            bb["xmin"],
-            bb["ymax"],
-            bb["zmin"],
-            bb["xmax"],
-            bb["ymax"],
-            bb["zmin"],
-            bb["xmin"],
-            bb["ymax"],
-            bb["zmin"],
-            bb["xmin"],
-            bb["ymax"],
-            bb["zmax"],
-            bb["xmin"],
-            bb["ymin"],
-            bb["zmax"],
-            bb["xmax"],
-            bb["ymin"],
-            bb["zmax"],
-            bb["xmin"],
-            bb["ymin"],
-            bb["zmax"],
-            bb["xmin"],
-            bb["ymax"],
-            bb["zmax"],
-            bb["xmin"],
-            bb["ymin"],
-            bb["zmin"],
-            bb["xmax"],
-            bb["ymin"],
-            bb["zmin"],
-            bb["xmin"],
-            bb["ymin"],
-            bb["zmin"],
-            bb["xmin"],
-            bb["ymax"],
-            bb["zmin"],
-            bb["xmin"],
-            bb["ymin"],
-            bb["zmin"],
-            bb["xmin"],
-            bb["ymin"],
-            bb["zmax"],
+            [bb["xmin"], bb["ymin"], bb["zmin"]],
+            [bb["xmax"], bb["ymax"], bb["zmax"]],
         ],
         dtype="float32",
     )
+    return bounds[_BBOX_EDGES, (0, 1, 2)].ravel()
@@ -20,26 +20,29 @@ def dump_vertex(id, v):
 
 
 class Trace:
+    # call sites check `enabled` before building their ids, so a disabled trace
+    # costs one attribute lookup per face, edge or vertex
     def __init__(self, filename):
-        if DEBUG:
+        self.enabled = DEBUG
+        if self.enabled:
             self.file = open(filename, "a")
 
     def face(self, id, f):
-        if DEBUG:
+        if self.enabled:
             self.file.write(dump_face(id, f) + "\n")
 
     def edge(self, id, e):
-        if DEBUG:
+        if self.enabled:
             self.file.write(dump_edge(id, e) + "\n")
 
     def vertex(self, id, v):
-        if DEBUG:
+        if self.enabled:
             self.file.write(dump_vertex(id, v) + "\n")
 
     def message(self, msg):
-        if DEBUG:
+        if self.enabled:
             self.file.write(msg + "\n")
 
     def close(self):
-        if DEBUG:
+        if self.enabled:
             self.file.close()
@@ -1,17 +1,27 @@
 import base64
+import functools
 import json
 import math
 import time
 import warnings
+import zlib
 
 import numpy as np
-from webcolors import hex_to_rgb, name_to_rgb, rgb_to_hex
+from webcolors import hex_to_rgb, name_to_rgb, names, rgb_to_hex
 
 
 def round_sig(x, sig):
     return round(x, sig - int(math.floor(math.log10(abs(x)))) - 1)
 
 
+def round_bits(x, bits):
+    # round to `bits` significant binary digits (10 bits ~ 3 decimal digits)
+    if x == 0:
+        return 0.0
+    k = bits - math.frexp(x)[1]
+    return math.ldexp(round(math.ldexp(x, k)), -k)
+
+
 def warn(message, warning=RuntimeWarning, when="always"):
     def warning_on_one_line(
         message, category, filename, lineno, file=None, line=None
@@ -31,6 +41,28 @@ def warn(message, warning=RuntimeWarning, when="always"):
 #
 
 
+# css3 color names are a fixed set, resolve them with a single dict lookup
+_NAME2RGB = {name: tuple(name_to_rgb(name)) for name in names("css3")}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_color_str(color):
+    # web color string #rrggbb or #rrggbbaa, or a css color name
+    a = None
+    if color[0] == "#":
+        if len(color) > 7:
+            c = hex_to_rgb(color[:7])
+            a = int(color[7:9], 16) / 255
+        else:
+            c = hex_to_rgb(color)
+    else:
+        rgb = _NAME2RGB.get(color.lower())
+        if rgb is not None:
+            return (*rgb, a)
+        c = name_to_rgb(color)
+    return c.red, c.green, c.blue, a
+
+
 class Color:
     def __init__(self, color, alpha=1.0):
         self.a = alpha
@@ -41,25 +73,17 @@ class Color:
 
         # web color string #rrggbb or #rrggbbaa
         elif isinstance(color, str):
-            if color[0] == "#":
-                # aa overwrites self.a
-                if len(color) > 7:
-                    c = hex_to_rgb(color[:7])
-                    self.a = int(color[7:9], 16) / 255
-                else:
-                    c = hex_to_rgb(color)
-            else:
-                c = name_to_rgb(color)
-            self.r = c.red
-            self.g = c.green
-            self.b = c.blue
+            self.r, self.g, self.b, a = _parse_color_str(color)
+            # aa overwrites self.a
+            if a is not None:
+                self.a = a
         elif isinstance(color, (tuple, list)) and len(color) >= 3:
             rgb = color[:3]
-            if any([isinstance(c, float) for c in rgb]) and all(
-                [0.0 <= c <= 1.0 for c in rgb]
+            if any(isinstance(c, float) for c in rgb) and all(
+                0.0 <= c <= 1.0 for c in rgb
             ):
                 self.r, self.g, self.b = (int(c * 255) for c in rgb)
-            elif all([isinstance(c, int) and (0 <= c <= 255) for c in rgb]):
+            elif all(isinstance(c, int) and (0 <= c <= 255) for c in rgb):
                 self.r, self.g, self.b = rgb
             else:
                 self._invalid(color)
@@ -175,23 +199,21 @@ def get_color(in_color, def_color, alpha):
 def make_unique(names):
     found = {}
     unique_names = []
+    append = unique_names.append
     for name in names:
         if name is None:
-            unique_names.append(None)
+            append(None)
             continue
 
-        if found.get(name) is None:
-            found[name] = 1
-            unique_names.append(name)
-        else:
-            found[name] += 1
-            unique_names.append(f"{name}({found[name]})")
+        count = found.get(name, 0) + 1
+        found[name] = count
+        append(name if count == 1 else f"{name}({count})")
 
     return unique_names
 
 
 def distance(v1, v2):
-    return np.linalg.norm([x - y for x, y in zip(v1, v2)])
+    return math.dist(v1, v2)
 
 
 def px(w):
@@ -224,18 +246,24 @@ def flatten(nested_list):
 #
 
 
-def numpy_to_buffer_json(value):
+def numpy_to_buffer_json(value, compress=False):
+    # compress=True deflates the array buffers before base64 encoding (codec "zlib+b64").
+    # Only use it with viewers that can inflate the buffers, the default stays plain "b64"
     def walk(obj):
         if isinstance(obj, np.ndarray):
             if not obj.flags["C_CONTIGUOUS"]:
                 obj = np.ascontiguousarray(obj)
 
             obj = obj.ravel()
+            if compress:
+                buffer, codec = zlib.compress(memoryview(obj), 1), "zlib+b64"
+            else:
+                buffer, codec = memoryview(obj), "b64"
             return {
                 "shape": obj.shape,
                 "dtype": str(obj.dtype),
-                "buffer": base64.b64encode(memoryview(obj)).decode(),
-                "codec": "b64",
+                "buffer": base64.b64encode(buffer).decode(),
+                "codec": codec,
             }
         elif isinstance(obj, (tuple, list)):
             return [walk(el) for el in obj]
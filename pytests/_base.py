@@ -0,0 +1,14 @@
+import unittest
+
+import numpy as np
+
+
+class MyUnitTest(unittest.TestCase):
+    def _assertTupleAlmostEquals(self, expected, actual, places, msg=None):
+        np.testing.assert_allclose(
+            np.asarray(actual, dtype=np.float64),
+            np.asarray(expected, dtype=np.float64),
+            rtol=0,
+            atol=10.0 ** (-places),
+            err_msg=msg or "",
+        )
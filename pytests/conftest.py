@@ -0,0 +1,106 @@
+import pytest
+
+# Session scoped build123d objects: each one is only built when a test needs it
+# and then shared by all tests of the session.
+
+
+@pytest.fixture(scope="session")
+def b123d():
+    # import build123d on first use only, so that conftest.py doesn't add it to
+    # test runs that don't need it (e.g. pytests/test_cadquery.py)
+    import build123d
+
+    return build123d
+
+
+# %% algebra mode
+
+
+@pytest.fixture(scope="session")
+def box_b(b123d):
+    return b123d.Box(1, 2, 3)
+
+
+@pytest.fixture(scope="session")
+def box_b2(b123d):
+    return b123d.Box(1, 1, 1) - b123d.Box(2, 2, 0.2)
+
+
+@pytest.fixture(scope="session")
+def box_b2_lists(box_b2):
+    # the topology explorer runs once per kind instead of once per test
+    kinds = ("solids", "shells", "faces", "wires", "edges", "vertices")
+    return {kind: getattr(box_b2, kind)() for kind in kinds}
+
+
+@pytest.fixture(scope="session")
+def cone_s2(b123d):
+    s2 = b123d.Solid.make_cone(2, 1, 2).move(b123d.Location((-3, 3, 3)))
+    s2.label, s2.color = "cone", "green"
+    return s2
+
+
+# %% builder mode
+
+
+@pytest.fixture(scope="session")
+def buildpart_bp(b123d):
+    with b123d.BuildPart() as bp:
+        b123d.Box(1, 1, 1)
+    return bp
+
+
+@pytest.fixture(scope="session")
+def buildpart_bp2(b123d):
+    with b123d.BuildPart() as bp2:
+        b123d.Box(1, 1, 1)
+        b123d.Box(2, 2, 0.2, mode=b123d.Mode.SUBTRACT)
+    return bp2
+
+
+@pytest.fixture(scope="session")
+def buildsketch_bs(b123d):
+    with b123d.BuildSketch(b123d.Plane.YZ) as bs:
+        b123d.Rectangle(1, 1)
+    return bs
+
+
+@pytest.fixture(scope="session")
+def buildsketch_bs2(b123d):
+    with b123d.BuildSketch(b123d.Plane.YZ) as bs2:
+        b123d.Rectangle(1, 1)
+        b123d.Rectangle(2, 0.2, mode=b123d.Mode.SUBTRACT)
+    return bs2
+
+
+@pytest.fixture(scope="session")
+def buildline_bl(b123d):
+    with b123d.BuildLine() as bl:
+        b123d.Line((0, 0), (0, 1))
+    return bl
+
+
+@pytest.fixture(scope="session")
+def buildline_bl2(b123d):
+    with b123d.BuildLine() as bl2:
+        b123d.Line((0, 0), (0, 1))
+        b123d.Line((0, 0.4), (0, 0.6), mode=b123d.Mode.SUBTRACT)
+    return bl2
+
+
+# %% compounds
+
+
+@pytest.fixture(scope="session")
+def compound_mixed(b123d):
+    c = b123d.Compound([b123d.Sphere(1.2), b123d.Circle(2).wire()])
+    return b123d.Compound(
+        [b123d.Box(1, 2, 3), b123d.Circle(1), b123d.Line((0, 0), (1, 1)), c]
+    )
+
+
+@pytest.fixture(scope="session")
+def compound_unmixed(b123d):
+    c1 = b123d.Compound([b123d.Box(1, 2, 3), b123d.Sphere(1)])
+    c2 = b123d.Compound([b123d.Cone(1, 2, 3), b123d.Box(1, 1, 1)])
+    return b123d.Compound([c1, c2])
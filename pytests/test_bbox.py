@@ -0,0 +1,107 @@
+import numpy as np
+from build123d import *
+
+from ocp_tessellate.ocp_utils import *
+
+from _base import MyUnitTest
+
+
+def bb_tuple(bb):
+    return tuple(bb[k] for k in ("xmin", "xmax", "ymin", "ymax", "zmin", "zmax"))
+
+
+class TestNpBbox(MyUnitTest):
+    """Tests for the numpy bounding box of tessellated vertices"""
+
+    def setUp(self):
+        self.points = np.array(
+            [[0, 0, 0], [1, 0, 0], [1, 2, 0], [0, 2, 3]], dtype=np.float32
+        ).reshape(-1)
+
+    def test_empty(self):
+        self.assertIsNone(np_bbox(np.array([], dtype=np.float32), None, None))
+
+    def test_no_location(self):
+        bb = np_bbox(self.points, None, None)
+        self._assertTupleAlmostEquals((0, 1, 0, 2, 0, 3), bb_tuple(bb), 6)
+
+    def test_translation(self):
+        bb = np_bbox(self.points, (1, 2, 3), (0, 0, 0, 1))
+        self._assertTupleAlmostEquals((1, 2, 2, 4, 3, 6), bb_tuple(bb), 6)
+
+    def test_rotation(self):
+        loc = Location((1, 2, 3), (0, 0, 1), 90)
+        t, q = loc_to_tq(loc.wrapped)
+        bb = np_bbox(self.points, t, q)
+        # rotating around z by 90° maps (x, y) to (-y, x)
+        self._assertTupleAlmostEquals((-1, 1, 2, 3, 3, 6), bb_tuple(bb), 6)
+
+    def test_rotation_chunked(self):
+        points = np.random.default_rng(1).random(3 * (NP_BBOX_CHUNK + 10))
+        loc = Location((1, 2, 3), (1, 1, 0), 30)
+        t, q = loc_to_tq(loc.wrapped)
+        v = rotate(q, points.reshape(-1, 3)) + np.asarray(t)
+        bb = np_bbox(points, t, q)
+        self._assertTupleAlmostEquals(
+            (v[:, 0].min(), v[:, 0].max(), v[:, 1].min())
+            + (v[:, 1].max(), v[:, 2].min(), v[:, 2].max()),
+            bb_tuple(bb),
+            6,
+        )
+
+
+class TestBoundingBox(MyUnitTest):
+    """Tests for the BoundingBox class"""
+
+    def test_shape(self):
+        bb = BoundingBox(Box(1, 2, 3).wrapped)
+        self._assertTupleAlmostEquals(
+            (-0.5, 0.5, -1, 1, -1.5, 1.5), bb_tuple(bb.to_dict()), 6
+        )
+        self._assertTupleAlmostEquals((1, 2, 3), (bb.xsize, bb.ysize, bb.zsize), 6)
+        self._assertTupleAlmostEquals((0, 0, 0), bb.center, 6)
+        self.assertAlmostEqual(bb.max, 1.5, 6)
+
+    def test_update(self):
+        bb = BoundingBox(
+            {"xmin": 0, "xmax": 1, "ymin": 0, "ymax": 1, "zmin": 0, "zmax": 1}
+        )
+        bb.update({"xmin": -1, "xmax": 0, "ymin": 0, "ymax": 3, "zmin": 0, "zmax": 1})
+        self._assertTupleAlmostEquals((-1, 1, 0, 3, 0, 1), bb_tuple(bb.to_dict()), 6)
+        self._assertTupleAlmostEquals((0, 1.5, 0.5), bb.center, 6)
+
+    def test_set_bound(self):
+        bb = BoundingBox(
+            {"xmin": 0, "xmax": 1, "ymin": 0, "ymax": 2, "zmin": 0, "zmax": 2}
+        )
+        self.assertAlmostEqual(bb.max_dist_from_center(), 1.5, 6)
+        bb.xmax = 3
+        self.assertEqual(bb.xmax, 3)
+        # the corners are rebuilt from the new bound
+        self.assertAlmostEqual(bb._get_corners()[:, 0].max(), 3, 6)
+
+    def test_max_dist(self):
+        bb = BoundingBox(
+            {"xmin": 0, "xmax": 1, "ymin": 0, "ymax": 2, "zmin": 0, "zmax": 2}
+        )
+        self.assertAlmostEqual(bb.max_dist_from_origin(), 3, 6)
+        self.assertAlmostEqual(bb.max_dist_from_center(), 1.5, 6)
+
+    def test_from_compound(self):
+        b1 = Box(1, 1, 1).wrapped
+        b2 = Pos(2, 0, 0) * Box(1, 1, 1)
+        bb = BoundingBox.from_compound([b1, b2.wrapped])
+        self._assertTupleAlmostEquals(
+            (-0.5, 2.5, -0.5, 0.5, -0.5, 0.5), bb_tuple(bb.to_dict()), 6
+        )
+
+
+class TestBoundingBoxCache(MyUnitTest):
+    """Tests for the cached bounding_box function"""
+
+    def test_moved_copies(self):
+        box = Box(1, 1, 1).wrapped
+        for i in range(200):
+            # each copy is released after the call, so its id can be reused
+            bb = bounding_box(box.Moved(Pos(10 * i, 0, 0).wrapped))
+            self.assertAlmostEqual(bb.xmin, 10 * i - 0.5, 6)
@@ -1,90 +1,50 @@
 # %%
-import unittest
-
 import build123d as bd
 import pytest
 import webcolors
-from build123d import *
+from build123d import Axis, Box, Compound, Location, Part, Plane, Pos, Vector
 
 from ocp_tessellate.convert import OcpConverter
 from ocp_tessellate.ocp_utils import *
 
-
-class MyUnitTest(unittest.TestCase):
-    def _assertTupleAlmostEquals(self, expected, actual, places, msg=None):
-        for i, j in zip(actual, expected):
-            self.assertAlmostEqual(i, j, places, msg=msg)
-
+from _base import MyUnitTest
 
 # %%
 
-colormap = list(webcolors._definitions._CSS3_NAMES_TO_HEX.items())
-
-b = Box(1, 2, 3)
-b2 = Box(1, 1, 1) - Box(2, 2, 0.2)
-
-with BuildPart() as bp:
-    Box(1, 1, 1)
-
-with BuildPart() as bp2:
-    Box(1, 1, 1)
-    Box(2, 2, 0.2, mode=Mode.SUBTRACT)
-
-r = Rectangle(1, 2)
-r2 = Rectangle(1, 2) - Rectangle(2, 0.2)
-
-with BuildSketch(Plane.YZ) as bs:
-    Rectangle(1, 1)
-
-with BuildSketch(Plane.YZ) as bs2:
-    Rectangle(1, 1)
-    Rectangle(2, 0.2, mode=Mode.SUBTRACT)
-
-l = Line((0, 0), (0, 1))
-l2 = Line((0, 0), (0, 1)) - Line((0, 0.4), (0, 0.6))
-
-with BuildLine() as bl:
-    Line((0, 0), (0, 1))
-
-with BuildLine() as bl2:
-    Line((0, 0), (0, 1))
-    Line((0, 0.4), (0, 0.6), mode=Mode.SUBTRACT)
-
-# Create some objects to add to the compounds
-s1 = Solid.make_box(1, 1, 1).move(Location((3, 3, 3)))
-s1.label, s1.color = "box", "red"
-
-s2 = Solid.make_cone(2, 1, 2).move(Location((-3, 3, 3)))
-s2.label, s2.color = "cone", "green"
-
-s3 = Solid.make_cylinder(1, 2).move(Location((-3, -3, 3)))
-s3.label, s3.color = "cylinder", "blue"
-
-s4 = Solid.make_sphere(2).move(Location((3, 3, -3)))
-s4.label = "sphere"
-
-s5 = Solid.make_torus(3, 1).move(Location((-3, 3, -3)))
-s5.label, s5.color = "torus", "cyan"
-
-c2 = Compound(label="c2", children=[s2, s3])
-c3 = Compound(label="c3", children=[s4, s5])
-c1 = Compound(label="c1", children=[s1, c2, c3])
-
-c = Compound([Sphere(1.2), Circle(2).wire()])
-mixed = Compound([Box(1, 2, 3), Circle(1), Line((0, 0), (1, 1)), c])
-
-c1 = Compound([Box(1, 2, 3), Sphere(1)])
-c2 = Compound([Cone(1, 2, 3), Box(1, 1, 1)])
-unmixed = Compound([c1, c2])
+CSS3_NAMES = tuple(webcolors._definitions._CSS3_NAMES_TO_HEX.keys())
+CSS3_HEXES = tuple(webcolors._definitions._CSS3_NAMES_TO_HEX.values())
 
 
 class TestsConvert(MyUnitTest):
     """Tests for the OcpConverter class"""
 
+    @pytest.fixture(autouse=True)
+    def _shapes(
+        self,
+        box_b,
+        box_b2,
+        buildpart_bp,
+        buildpart_bp2,
+        buildsketch_bs,
+        buildsketch_bs2,
+        buildline_bl,
+        buildline_bl2,
+        box_b2_lists,
+    ):
+        self.b = box_b
+        self.b2 = box_b2
+        self.bp = buildpart_bp
+        self.bp2 = buildpart_bp2
+        self.bs = buildsketch_bs
+        self.bs2 = buildsketch_bs2
+        self.bl = buildline_bl
+        self.bl2 = buildline_bl2
+        self.b2_lists = box_b2_lists
+
     def test_buildpart(self):
         """Test that a part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bp)
+        g = c.to_ocp(self.bp)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -97,7 +57,7 @@ class TestsConvert(MyUnitTest):
     def test_buildsketch(self):
         """Test that a sketch is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bs)
+        g = c.to_ocp(self.bs)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -110,20 +70,21 @@ class TestsConvert(MyUnitTest):
     def test_buildsketch_local(self):
         """Test that a sketch_local is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bs, sketch_local=True)
+        g = c.to_ocp(self.bs, sketch_local=True)
         i = c.instances
         self.assertEqual(g.length, 2)
         o = g.objects[0]
         self.assertEqual(g.name, "Face")
         for o, n in zip(g.objects, ["sketch", "sketch_local"]):
-            self.assertEqual(o.name, n)
-            self.assertEqual(o.kind, "face")
-            self.assertTrue(is_topods_face(i[o.ref]["obj"]))
+            with self.subTest(name=n):
+                self.assertEqual(o.name, n)
+                self.assertEqual(o.kind, "face")
+                self.assertTrue(is_topods_face(i[o.ref]["obj"]))
 
     def test_buildline(self):
         """Test that a line is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bl)
+        g = c.to_ocp(self.bl)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -135,7 +96,7 @@ class TestsConvert(MyUnitTest):
     def test_buildpart_2(self):
         """Test that a part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bp2)
+        g = c.to_ocp(self.bp2)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -148,7 +109,7 @@ class TestsConvert(MyUnitTest):
     def test_buildsketch_2(self):
         """Test that a sketch is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bs2)
+        g = c.to_ocp(self.bs2)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -161,20 +122,21 @@ class TestsConvert(MyUnitTest):
     def test_buildsketch_local_2(self):
         """Test that a sketch_local is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bs2, sketch_local=True)
+        g = c.to_ocp(self.bs2, sketch_local=True)
         i = c.instances
         self.assertEqual(g.length, 2)
         o = g.objects[0]
         self.assertEqual(g.name, "Face")
         for o, n in zip(g.objects, ["sketch", "sketch_local"]):
-            self.assertEqual(o.name, n)
-            self.assertEqual(o.kind, "face")
-            self.assertTrue(is_topods_compound(i[o.ref]["obj"]))
+            with self.subTest(name=n):
+                self.assertEqual(o.name, n)
+                self.assertEqual(o.kind, "face")
+                self.assertTrue(is_topods_compound(i[o.ref]["obj"]))
 
     def test_buildline_2(self):
         """Test that a line is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(bl2)
+        g = c.to_ocp(self.bl2)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -187,7 +149,7 @@ class TestsConvert(MyUnitTest):
     def test_buildpart_name(self):
         """Test that the name is set correctly for a part"""
         c = OcpConverter()
-        g = c.to_ocp(bp, names=["bp"])
+        g = c.to_ocp(self.bp, names=["bp"])
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -200,7 +162,7 @@ class TestsConvert(MyUnitTest):
     def test_buildsketch_name(self):
         """Test that the name is set correctly for a sketch"""
         c = OcpConverter()
-        g = c.to_ocp(bs, names=["bs"])
+        g = c.to_ocp(self.bs, names=["bs"])
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -213,40 +175,42 @@ class TestsConvert(MyUnitTest):
     def test_buildsketch_local_name(self):
         """Test that the name is set correctly for a sketch_local"""
         c = OcpConverter()
-        g = c.to_ocp(bs, names=["bs"], sketch_local=True)
+        g = c.to_ocp(self.bs, names=["bs"], sketch_local=True)
         i = c.instances
         self.assertEqual(g.length, 2)
         self.assertEqual(g.name, "bs")
         for o, n in zip(g.objects, ["sketch", "sketch_local"]):
-            self.assertEqual(o.name, n)
-            self.assertEqual(o.kind, "face")
-            self.assertIsNotNone(o.ref)
-            self.assertIsNone(o.obj)
-            self.assertTrue(is_topods_face(i[o.ref]["obj"]))
-            loc = loc_to_tq(o.loc)
-            self._assertTupleAlmostEquals(loc[0], (0, 0, 0), 6)
-            if n == "sketch":
-                self._assertTupleAlmostEquals(loc[1], (0.5, 0.5, 0.5, 0.5), 6)
-            else:
-                self._assertTupleAlmostEquals(loc[1], (0, 0, 0, 1), 6)
+            with self.subTest(name=n):
+                self.assertEqual(o.name, n)
+                self.assertEqual(o.kind, "face")
+                self.assertIsNotNone(o.ref)
+                self.assertIsNone(o.obj)
+                self.assertTrue(is_topods_face(i[o.ref]["obj"]))
+                loc = loc_to_tq(o.loc)
+                self._assertTupleAlmostEquals(loc[0], (0, 0, 0), 6)
+                if n == "sketch":
+                    self._assertTupleAlmostEquals(loc[1], (0.5, 0.5, 0.5, 0.5), 6)
+                else:
+                    self._assertTupleAlmostEquals(loc[1], (0, 0, 0, 1), 6)
 
     def test_buildsketch_local_color(self):
         """Test that the color is set correctly for a sketch_local"""
         c = OcpConverter()
-        g = c.to_ocp(bs, sketch_local=True)
+        g = c.to_ocp(self.bs, sketch_local=True)
         i = c.instances
         self.assertEqual(g.length, 2)
         o = g.objects[0]
         self.assertEqual(g.name, "Face")
         for o, n in zip(g.objects, ["sketch", "sketch_local"]):
-            self.assertEqual(o.name, n)
-            self.assertEqual(o.kind, "face")
-            self.assertTrue(is_topods_face(i[o.ref]["obj"]))
+            with self.subTest(name=n):
+                self.assertEqual(o.name, n)
+                self.assertEqual(o.kind, "face")
+                self.assertTrue(is_topods_face(i[o.ref]["obj"]))
 
     def test_buildline_name_color(self):
         """Test that the name and color are set correctly for a line"""
         c = OcpConverter()
-        g = c.to_ocp(bl, names=["bl"])
+        g = c.to_ocp(self.bl, names=["bl"])
         self.assertEqual(g.length, 1)
         i = c.instances
         o = g.objects[0]
@@ -258,7 +222,7 @@ class TestsConvert(MyUnitTest):
     def test_part_wrapped(self):
         """Test that a wrapped part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.wrapped)
+        g = c.to_ocp(self.b.wrapped)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -271,7 +235,7 @@ class TestsConvert(MyUnitTest):
     def test_part_wrapped_2(self):
         """Test that a wrapped part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.wrapped)
+        g = c.to_ocp(self.b2.wrapped)
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -281,294 +245,102 @@ class TestsConvert(MyUnitTest):
         self.assertIsNone(o.obj)
         self.assertTrue(is_topods_compound(i[o.ref]["obj"]))
 
-    def test_show_solid_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.solid())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#e8b024")
-
-    def test_show_solids_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.solids())
-        o = g.objects[0]
-        self.assertEqual(g.length, 1)
-        self.assertEqual(o.color.web_color, "#e8b024")
-
-    def test_show_solids_list_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(*b2.solids())
-        self.assertEqual(g.length, 2)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#e8b024")
-
-    def test_show_shell_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.shell())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ee82ee")
-
-    def test_show_shells_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.shells())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ee82ee")
-
-    def test_show_shells_list_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(*b2.shells())
-        self.assertEqual(g.length, 2)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#ee82ee")
-
-    def test_show_face_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.face())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ee82ee")
-
-    def test_show_faces_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.faces())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ee82ee")
-
-    def test_show_faces_list_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(*b2.faces())
-        self.assertEqual(g.length, 12)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#ee82ee")
-
-    def test_show_wire_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.wire())
-        self.assertEqual(g.length, 1)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_wires_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.wires())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_wires_list_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(*b2.wires())
-        self.assertEqual(g.length, 12)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_edge_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.edge())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_edges_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.edges())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_edges_list_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(*b2.edges())
-        self.assertEqual(g.length, 24)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_vertex_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.vertex())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_vertices_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(b2.vertices())
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.color.web_color, "#ba55d3")
-
-    def test_show_vertices_list_default_colors(self):
-        c = OcpConverter()
-        g = c.to_ocp(*b2.vertices())
-        self.assertEqual(g.length, 16)
-        for o in g.objects:
-            self.assertEqual(o.color.web_color, "#ba55d3")
-
     #
 
     def test_show_solid_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.solid(), names=["MySolid"], colors=[colormap[0][0]])
+        g = c.to_ocp(self.b2.solid(), names=["MySolid"], colors=[CSS3_NAMES[0]])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
-        self.assertEqual(o.color.web_color, colormap[0][1])
+        self.assertEqual(o.color.web_color, CSS3_HEXES[0])
         self.assertEqual(o.name, "MySolid")
 
     def test_show_solids_colors_names(self):
         c = OcpConverter()
         names = ["MySolidShapeList"]
         colors = [bd.Color("Orange", 0.7)]
-        g = c.to_ocp(b2.solids(), names=names, colors=colors)
+        g = c.to_ocp(self.b2_lists["solids"], names=names, colors=colors)
         o = g.objects[0]
         self.assertEqual(g.length, 1)
         self.assertEqual(o.color.web_color, "#ff5f00")
         self.assertAlmostEqual(o.color.a, 0.7, 6)
         self.assertEqual(o.name, "MySolidShapeList")
 
-    def test_show_solids_list_colors_names(self):
-        c = OcpConverter()
-        objs = b2.solids()
-        names = [f"MySolid_{ind}" for ind in range(len(objs))]
-        colors = [colormap[ind][0] for ind in range(len(objs))]
-        g = c.to_ocp(*objs, names=names, colors=colors)
-        self.assertEqual(g.length, 2)
-        for ind, o in enumerate(g.objects):
-            self.assertEqual(o.color.web_color, colormap[ind][1])
-            self.assertEqual(o.name, f"MySolid_{ind}")
-
     def test_show_shell_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.shell(), colors=[colormap[0][0]])
+        g = c.to_ocp(self.b2.shell(), colors=[CSS3_NAMES[0]])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
-        self.assertEqual(o.color.web_color, colormap[0][1])
+        self.assertEqual(o.color.web_color, CSS3_HEXES[0])
 
     def test_show_shells_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.shells(), colors=[bd.Color("Orange", 0.7)])
+        g = c.to_ocp(self.b2_lists["shells"], colors=[bd.Color("Orange", 0.7)])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.color.web_color, "#ff5f00")
 
-    def test_show_shells_list_colors_names(self):
-        c = OcpConverter()
-        objs = b2.shells()
-        names = [f"MyShell_{ind}" for ind in range(len(objs))]
-        colors = [colormap[ind][0] for ind in range(len(objs))]
-        g = c.to_ocp(*objs, names=names, colors=colors)
-        self.assertEqual(g.length, 2)
-        for ind, o in enumerate(g.objects):
-            self.assertEqual(o.color.web_color, colormap[ind][1])
-            self.assertEqual(o.name, f"MyShell_{ind}")
-
     def test_show_face_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.face(), colors=[colormap[0][0]])
+        g = c.to_ocp(self.b2.face(), colors=[CSS3_NAMES[0]])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
-        self.assertEqual(o.color.web_color, colormap[0][1])
+        self.assertEqual(o.color.web_color, CSS3_HEXES[0])
 
     def test_show_faces_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.faces(), colors=[bd.Color("Orange", 0.7)])
+        g = c.to_ocp(self.b2_lists["faces"], colors=[bd.Color("Orange", 0.7)])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.color.web_color, "#ff5f00")
 
-    def test_show_faces_list_colors_names(self):
-        c = OcpConverter()
-        objs = b2.faces()
-        names = [f"MyFace_{ind}" for ind in range(len(objs))]
-        colors = [colormap[ind][0] for ind in range(len(objs))]
-        g = c.to_ocp(*objs, names=names, colors=colors)
-        self.assertEqual(g.length, 12)
-        for ind, o in enumerate(g.objects):
-            self.assertEqual(o.color.web_color, colormap[ind][1])
-            self.assertEqual(o.name, f"MyFace_{ind}")
-
     def test_show_wire_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.wire(), colors=[colormap[0][0]])
+        g = c.to_ocp(self.b2.wire(), colors=[CSS3_NAMES[0]])
         self.assertEqual(g.length, 1)
         for o in g.objects:
-            self.assertEqual(o.color.web_color, colormap[0][1])
+            self.assertEqual(o.color.web_color, CSS3_HEXES[0])
 
     def test_show_wires_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.wires(), colors=[bd.Color("Orange", 1.0)])
+        g = c.to_ocp(self.b2_lists["wires"], colors=[bd.Color("Orange", 1.0)])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.color.web_color, "#ff5f00")
 
-    def test_show_wires_list_colors_names(self):
-        c = OcpConverter()
-        objs = b2.wires()
-        names = [f"MyWire_{ind}" for ind in range(len(objs))]
-        colors = [colormap[ind][0] for ind in range(len(objs))]
-        g = c.to_ocp(*objs, names=names, colors=colors)
-        self.assertEqual(g.length, 12)
-        for ind, o in enumerate(g.objects):
-            self.assertEqual(o.color.web_color, colormap[ind][1])
-            self.assertEqual(o.name, f"MyWire_{ind}")
-
     def test_show_edge_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.edge(), colors=[colormap[0][0]])
+        g = c.to_ocp(self.b2.edge(), colors=[CSS3_NAMES[0]])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
-        self.assertEqual(o.color.web_color, colormap[0][1])
+        self.assertEqual(o.color.web_color, CSS3_HEXES[0])
 
     def test_show_edges_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.edges(), colors=[bd.Color("Orange", 1.0)])
+        g = c.to_ocp(self.b2_lists["edges"], colors=[bd.Color("Orange", 1.0)])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.color.web_color, "#ff5f00")
 
-    def test_show_edges_list_colors_names(self):
-        c = OcpConverter()
-        objs = b2.edges()
-        names = [f"MyEdge_{ind}" for ind in range(len(objs))]
-        colors = [colormap[ind][0] for ind in range(len(objs))]
-        g = c.to_ocp(*objs, names=names, colors=colors)
-        self.assertEqual(g.length, 24)
-        for ind, o in enumerate(g.objects):
-            self.assertEqual(o.color.web_color, colormap[ind][1])
-            self.assertEqual(o.name, f"MyEdge_{ind}")
-
     def test_show_vertex_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.vertex(), colors=[colormap[0][0]])
+        g = c.to_ocp(self.b2.vertex(), colors=[CSS3_NAMES[0]])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
-        self.assertEqual(o.color.web_color, colormap[0][1])
+        self.assertEqual(o.color.web_color, CSS3_HEXES[0])
 
     def test_show_vertices_colors_names(self):
         c = OcpConverter()
-        g = c.to_ocp(b2.vertices(), colors=[bd.Color("Orange", 1.0)])
+        g = c.to_ocp(self.b2_lists["vertices"], colors=[bd.Color("Orange", 1.0)])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.color.web_color, "#ff5f00")
 
-    def test_show_vertices_list_colors_names(self):
-        c = OcpConverter()
-        objs = b2.vertices()
-        names = [f"MyVertex_{ind}" for ind in range(len(objs))]
-        colors = [colormap[ind][0] for ind in range(len(objs))]
-        g = c.to_ocp(*objs, names=names, colors=colors)
-        self.assertEqual(g.length, 16)
-        for ind, o in enumerate(g.objects):
-            self.assertEqual(o.color.web_color, colormap[ind][1])
-            self.assertEqual(o.name, f"MyVertex_{ind}")
-
     #
 
     def test_show_mixed_builder_shape(self):
         c = OcpConverter()
-        g = c.to_ocp(bl, Box(0.1, 0.1, 0.1))
+        g = c.to_ocp(self.bl, Box(0.1, 0.1, 0.1))
         self.assertEqual(g.length, 2)
         o = g.objects[0]
         self.assertEqual(o.name, "Edge")
@@ -598,68 +370,64 @@ class TestsConvert(MyUnitTest):
         self.assertTrue(is_topods_edge(o.obj[0]))
 
 
-class TestsConvert2(MyUnitTest):
-
-    def test_buildpart(self):
-        """Test that a part is converted correctly"""
-        c = OcpConverter()
-        g = c.to_ocp(bp2)
-        i = c.instances
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.name, "Solid")
-        self.assertEqual(o.kind, "solid")
-        self.assertIsNotNone(o.ref)
-        self.assertIsNone(o.obj)
-        self.assertTrue(is_topods_compound(i[o.ref]["obj"]))
-
-    def test_buildsketch(self):
-        """Test that a sketch is converted correctly"""
-        c = OcpConverter()
-        g = c.to_ocp(bs2)
-        i = c.instances
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.name, "Face")
-        self.assertEqual(o.kind, "face")
-        self.assertIsNotNone(o.ref)
-        self.assertIsNone(o.obj)
-        self.assertTrue(is_topods_compound(i[o.ref]["obj"]))
-
-    def test_buildsketch_local(self):
-        """Test that a sketch_local is converted correctly"""
-        c = OcpConverter()
-        g = c.to_ocp(bs2, sketch_local=True)
-        i = c.instances
-        self.assertEqual(g.length, 2)
-        o = g.objects[0]
-        self.assertEqual(g.name, "Face")
-        for o, n in zip(g.objects, ["sketch", "sketch_local"]):
-            self.assertEqual(o.name, n)
-            self.assertEqual(o.kind, "face")
-            self.assertTrue(is_topods_compound(i[o.ref]["obj"]))
-
-    def test_buildline(self):
-        """Test that a line is converted correctly"""
-        c = OcpConverter()
-        g = c.to_ocp(bl2)
-        i = c.instances
-        self.assertEqual(g.length, 1)
-        o = g.objects[0]
-        self.assertEqual(o.name, "Edge")
-        self.assertEqual(o.kind, "edge")
-        self.assertEqual(len(i), 0)
-        for i in range(2):
-            self.assertTrue(is_topods_edge(o.obj[i]))
+# (accessor, ShapeList accessor, default color, number of shapes of b2)
+SHOW_CASES = [
+    pytest.param("solid", "solids", "#e8b024", 2, id="solid"),
+    pytest.param("shell", "shells", "#ee82ee", 2, id="shell"),
+    pytest.param("face", "faces", "#ee82ee", 12, id="face"),
+    pytest.param("wire", "wires", "#ba55d3", 12, id="wire"),
+    pytest.param("edge", "edges", "#ba55d3", 24, id="edge"),
+    pytest.param("vertex", "vertices", "#ba55d3", 16, id="vertex"),
+]
+
+
+class TestShow:
+    """Tests for showing single shapes, ShapeLists and lists of shapes of b2"""
+
+    @pytest.mark.parametrize("kind, kinds, color, count", SHOW_CASES)
+    def test_show_default_colors(self, box_b2, kind, kinds, color, count):
+        g = OcpConverter().to_ocp(getattr(box_b2, kind)())
+        assert g.length == 1
+        assert g.objects[0].color.web_color == color
+
+    @pytest.mark.parametrize("kind, kinds, color, count", SHOW_CASES)
+    def test_show_shapelist_default_colors(
+        self, box_b2_lists, kind, kinds, color, count
+    ):
+        g = OcpConverter().to_ocp(box_b2_lists[kinds])
+        assert g.length == 1
+        assert g.objects[0].color.web_color == color
+
+    @pytest.mark.parametrize("kind, kinds, color, count", SHOW_CASES)
+    def test_show_list_default_colors(self, box_b2_lists, kind, kinds, color, count):
+        g = OcpConverter().to_ocp(*box_b2_lists[kinds])
+        assert g.length == count
+        for o in g.objects:
+            assert o.color.web_color == color
+
+    @pytest.mark.parametrize("kind, kinds, color, count", SHOW_CASES)
+    def test_show_list_colors_names(self, box_b2_lists, kind, kinds, color, count):
+        objs = box_b2_lists[kinds]
+        names = [f"My{kind.capitalize()}_{ind}" for ind in range(len(objs))]
+        g = OcpConverter().to_ocp(*objs, names=names, colors=CSS3_NAMES[:count])
+        assert g.length == count
+        for ind, o in enumerate(g.objects):
+            assert o.color.web_color == CSS3_HEXES[ind]
+            assert o.name == names[ind]
 
 
 class TestsShapeLists(MyUnitTest):
     """Tests for the OcpConverter class with shape lists"""
 
+    @pytest.fixture(autouse=True)
+    def _shapes(self, box_b, box_b2_lists):
+        self.b = box_b
+        self.b2_lists = box_b2_lists
+
     def test_shapelist_solids(self):
         """Test that a shapelist of solids is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.solids())
+        g = c.to_ocp(self.b.solids())
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -670,7 +438,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_shells(self):
         """Test that a shapelist of shells is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.shells())
+        g = c.to_ocp(self.b.shells())
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -681,7 +449,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_face(self):
         """Test that a shapelist of faces is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.faces())
+        g = c.to_ocp(self.b.faces())
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -692,7 +460,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_edge(self):
         """Test that a shapelist of edges is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.edges())
+        g = c.to_ocp(self.b.edges())
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.name, "ShapeList(Edge)")
@@ -703,7 +471,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_wire(self):
         """Test that a shapelist of wires is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.wires())
+        g = c.to_ocp(self.b.wires())
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.name, "ShapeList(Wire)")
@@ -714,7 +482,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_vertex(self):
         """Test that a shapelist of vertices is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.vertices())
+        g = c.to_ocp(self.b.vertices())
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.name, "ShapeList(Vertex)")
@@ -725,7 +493,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_solids_2(self):
         """Test that a shapelist of solids is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.solids())
+        g = c.to_ocp(self.b2_lists["solids"])
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -736,7 +504,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_shells_2(self):
         """Test that a shapelist of shells is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.shells())
+        g = c.to_ocp(self.b2_lists["shells"])
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -747,7 +515,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_face_2(self):
         """Test that a shapelist of faces is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.faces())
+        g = c.to_ocp(self.b2_lists["faces"])
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -758,7 +526,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_edge_2(self):
         """Test that a shapelist of edges is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.edges())
+        g = c.to_ocp(self.b2_lists["edges"])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.name, "ShapeList(Edge)")
@@ -769,7 +537,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_wire_2(self):
         """Test that a shapelist of wires is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.wires())
+        g = c.to_ocp(self.b2_lists["wires"])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.name, "ShapeList(Wire)")
@@ -780,7 +548,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_vertex_2(self):
         """Test that a shapelist of vertices is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b2.vertices())
+        g = c.to_ocp(self.b2_lists["vertices"])
         self.assertEqual(g.length, 1)
         o = g.objects[0]
         self.assertEqual(o.name, "ShapeList(Vertex)")
@@ -791,7 +559,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_solids_2_list(self):
         """Test that a shapelist of solids is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(*b2.solids())
+        g = c.to_ocp(*self.b2_lists["solids"])
         i = c.instances
         self.assertEqual(g.length, 2)
         for ind, o in enumerate(g.objects):
@@ -802,7 +570,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_shells_2_list(self):
         """Test that a shapelist of shells is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(*b2.shells())
+        g = c.to_ocp(*self.b2_lists["shells"])
         i = c.instances
         self.assertEqual(g.length, 2)
         for ind, o in enumerate(g.objects):
@@ -813,7 +581,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_face_2_list(self):
         """Test that a shapelist of faces is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(*b2.faces())
+        g = c.to_ocp(*self.b2_lists["faces"])
         i = c.instances
         self.assertEqual(g.length, 12)
         o = g.objects[0]
@@ -825,7 +593,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_edge_2_list(self):
         """Test that a shapelist of edges is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(*b2.edges())
+        g = c.to_ocp(*self.b2_lists["edges"])
         self.assertEqual(g.length, 24)
         o = g.objects[0]
         for ind, o in enumerate(g.objects):
@@ -836,7 +604,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_wire_2_list(self):
         """Test that a shapelist of wires is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(*b2.wires())
+        g = c.to_ocp(*self.b2_lists["wires"])
         self.assertEqual(g.length, 12)
         o = g.objects[0]
         for ind, o in enumerate(g.objects):
@@ -847,7 +615,7 @@ class TestsShapeLists(MyUnitTest):
     def test_shapelist_vertex_2_list(self):
         """Test that a shapelist of vertices is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(*b2.vertices())
+        g = c.to_ocp(*self.b2_lists["vertices"])
         self.assertEqual(g.length, 16)
         o = g.objects[0]
         for ind, o in enumerate(g.objects):
@@ -859,10 +627,14 @@ class TestsShapeLists(MyUnitTest):
 class TestsConvertMoved(MyUnitTest):
     """Tests for the OcpConverter class with moved objects"""
 
+    @pytest.fixture(autouse=True)
+    def _shapes(self, box_b):
+        self.b = box_b
+
     def test_part_wrapped_moved(self):
         """Test that a moved wrapped part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(b.wrapped.Moved(Location((2, 0, 0)).wrapped))
+        g = c.to_ocp(self.b.wrapped.Moved(Location((2, 0, 0)).wrapped))
         o = g.objects[0]
         i = c.instances
         self.assertEqual(o.name, "Solid")
@@ -874,7 +646,7 @@ class TestsConvertMoved(MyUnitTest):
     def test_part_algebra_moved(self):
         """Test that a moved algebra part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(Pos(4, 0, 0) * b)
+        g = c.to_ocp(Pos(4, 0, 0) * self.b)
         o = g.objects[0]
         i = c.instances
         self.assertEqual(o.name, "Solid")
@@ -886,7 +658,7 @@ class TestsConvertMoved(MyUnitTest):
     def test_part_wrapped_algebra_moved(self):
         """Test that a moved algebra wrapped part is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(Pos(6, 0, 0) * Part(b.wrapped))
+        g = c.to_ocp(Pos(6, 0, 0) * Part(self.b.wrapped))
         o = g.objects[0]
         i = c.instances
         self.assertEqual(o.name, "Solid")
@@ -898,7 +670,7 @@ class TestsConvertMoved(MyUnitTest):
     def test_compoud_algebra_moved(self):
         """Test that a moved algebra compound is converted correctly"""
         c = OcpConverter()
-        g = c.to_ocp(Pos(8, 0, 0) * Compound(b.wrapped))
+        g = c.to_ocp(Pos(8, 0, 0) * Compound(self.b.wrapped))
         o = g.objects[0]
         i = c.instances
         self.assertEqual(o.name, "Solid")
@@ -910,9 +682,14 @@ class TestsConvertMoved(MyUnitTest):
 
 class TestConvertMixedCompounds(MyUnitTest):
 
+    @pytest.fixture(autouse=True)
+    def _shapes(self, compound_mixed, compound_unmixed):
+        self.mixed = compound_mixed
+        self.unmixed = compound_unmixed
+
     def test_mixed_compound(self):
         c = OcpConverter()
-        g = c.to_ocp(mixed)
+        g = c.to_ocp(self.mixed)
         self.assertEqual(g.length, 4)
         i = c.instances
         o = g.objects[0]
@@ -940,7 +717,7 @@ class TestConvertMixedCompounds(MyUnitTest):
 
     def test_mixed_topods_compound(self):
         c = OcpConverter()
-        g = c.to_ocp(mixed.wrapped)
+        g = c.to_ocp(self.mixed.wrapped)
         self.assertEqual(g.length, 4)
         i = c.instances
         o = g.objects[0]
@@ -968,7 +745,7 @@ class TestConvertMixedCompounds(MyUnitTest):
 
     def test_unmixed(self):
         c = OcpConverter()
-        g = c.to_ocp(unmixed)
+        g = c.to_ocp(self.unmixed)
         self.assertEqual(g.length, 1)
         i = c.instances
         o = g.objects[0]
@@ -979,9 +756,13 @@ class TestConvertMixedCompounds(MyUnitTest):
 
 class TestCompund(MyUnitTest):
 
+    @pytest.fixture(autouse=True)
+    def _shapes(self, box_b2_lists):
+        self.b2_lists = box_b2_lists
+
     def test_compound_solid(self):
         c = OcpConverter()
-        g = c.to_ocp(Compound(b2.solids()))
+        g = c.to_ocp(Compound(self.b2_lists["solids"]))
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -993,7 +774,7 @@ class TestCompund(MyUnitTest):
 
     def test_compound_shell(self):
         c = OcpConverter()
-        g = c.to_ocp(Compound(b2.shells()))
+        g = c.to_ocp(Compound(self.b2_lists["shells"]))
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -1005,7 +786,7 @@ class TestCompund(MyUnitTest):
 
     def test_compound_face(self):
         c = OcpConverter()
-        g = c.to_ocp(Compound(b2.faces()))
+        g = c.to_ocp(Compound(self.b2_lists["faces"]))
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -1017,7 +798,7 @@ class TestCompund(MyUnitTest):
 
     def test_compound_wire(self):
         c = OcpConverter()
-        g = c.to_ocp(Compound(b2.wires()))
+        g = c.to_ocp(Compound(self.b2_lists["wires"]))
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -1030,7 +811,7 @@ class TestCompund(MyUnitTest):
 
     def test_compound_edge(self):
         c = OcpConverter()
-        g = c.to_ocp(Compound(b2.edges()))
+        g = c.to_ocp(Compound(self.b2_lists["edges"]))
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
@@ -1043,7 +824,7 @@ class TestCompund(MyUnitTest):
 
     def test_compound_solid(self):
         c = OcpConverter()
-        g = c.to_ocp(Compound(b2.vertices()))
+        g = c.to_ocp(Compound(self.b2_lists["vertices"]))
         i = c.instances
         self.assertEqual(g.length, 1)
         o = g.objects[0]
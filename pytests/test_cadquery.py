@@ -1,5 +1,3 @@
-import unittest
-
 import cadquery as cq
 import pytest
 import webcolors
@@ -7,17 +5,18 @@ import webcolors
 from ocp_tessellate.convert import OcpConverter, tessellate_group, to_ocpgroup
 from ocp_tessellate.ocp_utils import *
 
+from _base import MyUnitTest
 
-class MyUnitTest(unittest.TestCase):
-    def _assertTupleAlmostEquals(self, expected, actual, places, msg=None):
-        for i, j in zip(actual, expected):
-            self.assertAlmostEqual(i, j, places, msg=msg)
-
-
-colormap = list(webcolors._definitions._CSS3_NAMES_TO_HEX.items())
+CSS3_NAMES = tuple(webcolors._definitions._CSS3_NAMES_TO_HEX.keys())
+CSS3_HEXES = tuple(webcolors._definitions._CSS3_NAMES_TO_HEX.values())
 
 
 class TestWorkplane(MyUnitTest):
+    @classmethod
+    def setUpClass(cls):
+        # the boolean cut is the expensive part, build it once for all tests
+        cls.boxcut = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2))
+
     def test_box(self):
         result = cq.Workplane().box(1, 1, 1)
         c = OcpConverter()
@@ -33,7 +32,7 @@ class TestWorkplane(MyUnitTest):
         self.assertEqual(o.color.web_color, "#ff0000")
 
     def test_boxes_compound(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2))
+        result = self.boxcut
         c = OcpConverter()
         g = c.to_ocp(result, names=["Box"], colors=["red"])
         i = c.instances
@@ -47,7 +46,7 @@ class TestWorkplane(MyUnitTest):
         self.assertEqual(o.color.web_color, "#ff0000")
 
     def test_boxes(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2))
+        result = self.boxcut
         c = OcpConverter()
         g = c.to_ocp(*result.val(), names=["Box0", "Box1"], colors=["red", "green"])
         i = c.instances
@@ -63,7 +62,7 @@ class TestWorkplane(MyUnitTest):
             self.assertEqual(o.color.web_color, cols[ind])
 
     def test_faces_compound(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).faces()
+        result = self.boxcut.faces()
         c = OcpConverter()
         g = c.to_ocp(result, names=["Faces"], colors=["cyan"])
         i = c.instances
@@ -77,7 +76,7 @@ class TestWorkplane(MyUnitTest):
         self.assertEqual(o.color.web_color, "#00ffff")
 
     def test_wires_compound(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).wires()
+        result = self.boxcut.wires()
         c = OcpConverter()
         g = c.to_ocp(result, names=["Wires"], colors=["cyan"])
         i = c.instances
@@ -92,7 +91,7 @@ class TestWorkplane(MyUnitTest):
         self.assertEqual(o.color.web_color, "#00ffff")
 
     def test_edges_compound(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).edges()
+        result = self.boxcut.edges()
         c = OcpConverter()
         g = c.to_ocp(result, names=["Edges"], colors=["cyan"])
         i = c.instances
@@ -107,9 +106,7 @@ class TestWorkplane(MyUnitTest):
         self.assertEqual(o.color.web_color, "#00ffff")
 
     def test_vertices_compound(self):
-        result = (
-            cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).vertices()
-        )
+        result = self.boxcut.vertices()
         c = OcpConverter()
         g = c.to_ocp(result, names=["Vertex"], colors=["cyan"])
         i = c.instances
@@ -124,12 +121,12 @@ class TestWorkplane(MyUnitTest):
         self.assertEqual(o.color.web_color, "#00ffff")
 
     def test_faces(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).faces()
+        result = self.boxcut.faces()
         c = OcpConverter()
         g = c.to_ocp(
             *result.vals(),
             names=[f"face{i}" for i in range(12)],
-            colors=[c[0] for c in colormap[:12]],
+            colors=CSS3_NAMES[:12],
         )
         i = c.instances
         self.assertEqual(g.length, 12)
@@ -140,15 +137,15 @@ class TestWorkplane(MyUnitTest):
             self.assertIsNotNone(o.ref)
             self.assertIsNone(o.obj)
             self.assertTrue(is_topods_face(i[o.ref]["obj"]))
-            self.assertEqual(o.color.web_color, colormap[ind][1])
+            self.assertEqual(o.color.web_color, CSS3_HEXES[ind])
 
     def test_edges(self):
-        result = cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).edges()
+        result = self.boxcut.edges()
         c = OcpConverter()
         g = c.to_ocp(
             *result.vals(),
             names=[f"edge{i}" for i in range(24)],
-            colors=[c[0] for c in colormap[:24]],
+            colors=CSS3_NAMES[:24],
         )
         i = c.instances
         self.assertEqual(g.length, 24)
@@ -159,17 +156,15 @@ class TestWorkplane(MyUnitTest):
             self.assertIsNone(o.ref)
             self.assertIsNotNone(o.obj)
             self.assertTrue(is_topods_edge(o.obj))
-            self.assertEqual(o.color.web_color, colormap[ind][1])
+            self.assertEqual(o.color.web_color, CSS3_HEXES[ind])
 
     def test_vertices(self):
-        result = (
-            cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 0.2)).vertices()
-        )
+        result = self.boxcut.vertices()
         c = OcpConverter()
         g = c.to_ocp(
             *result.vals(),
             names=[f"vertex{i}" for i in range(16)],
-            colors=[c[0] for c in colormap[:16]],
+            colors=CSS3_NAMES[:16],
         )
         i = c.instances
         self.assertEqual(g.length, 16)
@@ -180,19 +175,20 @@ class TestWorkplane(MyUnitTest):
             self.assertIsNone(o.ref)
             self.assertIsNotNone(o.obj)
             self.assertTrue(is_topods_vertex(o.obj))
-            self.assertEqual(o.color.web_color, colormap[ind][1])
+            self.assertEqual(o.color.web_color, CSS3_HEXES[ind])
 
 
 class TestCadQuerySketch(MyUnitTest):
-    def test_trapezoid_vertices(self):
-        result = (
-            cq.Sketch()
-            .trapezoid(4, 3, 90)
-            .vertices()
-            .circle(0.5, mode="s")
-            .reset()
-            .vertices()
+    @classmethod
+    def setUpClass(cls):
+        # the trapezoid with the corner circles cut out is shared, tests work on copies
+        # since sketch operations modify the sketch in place
+        cls.trapezoid = (
+            cq.Sketch().trapezoid(4, 3, 90).vertices().circle(0.5, mode="s").reset()
         )
+
+    def test_trapezoid_vertices(self):
+        result = self.trapezoid.copy().vertices()
         c = OcpConverter()
         g = c.to_ocp(result)
         i = c.instances
@@ -215,15 +211,7 @@ class TestCadQuerySketch(MyUnitTest):
 
     def test_trapezoid_rarray(self):
         result = (
-            cq.Sketch()
-            .trapezoid(4, 3, 90)
-            .vertices()
-            .circle(0.5, mode="s")
-            .reset()
-            .vertices()
-            .fillet(0.25)
-            .reset()
-            .rarray(0.6, 1, 5, 1)
+            self.trapezoid.copy().vertices().fillet(0.25).reset().rarray(0.6, 1, 5, 1)
         )
         c = OcpConverter()
         g = c.to_ocp(result)
@@ -248,11 +236,7 @@ class TestCadQuerySketch(MyUnitTest):
 
     def test_trapezoid_reset(self):
         result = (
-            cq.Sketch()
-            .trapezoid(4, 3, 90)
-            .vertices()
-            .circle(0.5, mode="s")
-            .reset()
+            self.trapezoid.copy()
             .vertices()
             .fillet(0.25)
             .reset()
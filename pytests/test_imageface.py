@@ -1,5 +1,3 @@
-import unittest
-
 import pytest
 from build123d import *
 
@@ -7,11 +5,7 @@ from ocp_tessellate.cad_objects import ImageFace
 from ocp_tessellate.convert import OcpConverter
 from ocp_tessellate.ocp_utils import *
 
-
-class MyUnitTest(unittest.TestCase):
-    def _assertTupleAlmostEquals(self, expected, actual, places, msg=None):
-        for i, j in zip(actual, expected):
-            self.assertAlmostEqual(i, j, places, msg=msg)
+from _base import MyUnitTest
 
 
 class TestsImageFace(MyUnitTest):
@@ -1,21 +1,27 @@
-import copy
-import unittest
-
 import build123d as bd
+import pytest
 from build123d import *
+from OCP.TopLoc import TopLoc_Location
 
 from ocp_tessellate.convert import OcpConverter, tessellate_group
 from ocp_tessellate.ocp_utils import *
 
+from _base import MyUnitTest
+
+# progress marks depend on the state of the process wide tessellation cache,
+# hence keep the cache tests on one worker with pytest-xdist (--dist loadgroup)
+pytestmark = pytest.mark.xdist_group("tessellation-cache")
+
 
 def reference(obj, label, loc=None):
-    new_obj = copy.copy(obj)
+    # share the TShape: only the TopoDS handle and the python wrapper are new
+    # (copy.copy would deep copy the shape first and then re-link the TShape).
+    # Compound.cast picks the build123d class matching the topology type
+    moved = obj.wrapped.Moved(TopLoc_Location() if loc is None else loc.wrapped)
+    new_obj = Compound.cast(downcast(moved))
     if label is not None:
         new_obj.label = label
-    if loc is None:
-        return new_obj
-    else:
-        return new_obj.move(loc)
+    return new_obj
 
 
 class ProgressInstance:
@@ -25,7 +31,6 @@ class ProgressInstance:
         self.test = test
 
     def update(self, mark):
-        print(mark, end="", flush=True)
         if self.run == self.runs:
             self.test.assertTrue(mark in ["+", "*"])
         else:
@@ -40,7 +45,6 @@ class ProgressCache:
         self.test = test
 
     def update(self, mark):
-        print(mark, end="", flush=True)
         if self.run < self.crun:
             self.test.assertTrue(mark in ["+", "*"])
         else:
@@ -48,18 +52,15 @@ class ProgressCache:
         self.run += 1
 
 
-class MyUnitTest(unittest.TestCase):
-    def _assertTupleAlmostEquals(self, expected, actual, places, msg=None):
-        for i, j in zip(actual, expected):
-            self.assertAlmostEqual(i, j, places, msg=msg)
-
-
 class TestInstances(MyUnitTest):
     def test_reference(self):
         locs = HexLocations(6, 10, 10).local_locations
 
         sphere = Solid.make_sphere(5)
-        sphere_references = [reference(sphere, label="Sphere", loc=loc) for loc in locs]
+        # all references share the TShape of sphere.wrapped
+        sphere_references = [
+            Solid(sphere.wrapped.Moved(loc.wrapped), label="Sphere") for loc in locs
+        ]
         assembly = Compound(children=sphere_references)
         c = OcpConverter(progress=ProgressInstance(100, self))
         g = c.to_ocp(assembly, names=["Box"], colors=["red"])
@@ -97,3 +98,11 @@ class TestInstances(MyUnitTest):
         i = c.instances
         self.assertEqual(len(i), 4)
         _ = tessellate_group(g, i, progress=ProgressCache(3, self))
+
+    def test_reference_repeated_to_ocp(self):
+        b = Box(1, 2, 3)
+        c = OcpConverter()
+        g1 = c.to_ocp(b.wrapped)
+        g2 = c.to_ocp(b.wrapped.Moved(Location((2, 0, 0)).wrapped))
+        self.assertEqual(len(c.instances), 1)
+        self.assertEqual(g1.objects[0].ref, g2.objects[0].ref)
@@ -0,0 +1,71 @@
+from build123d import *
+from OCP.Bnd import Bnd_Box
+from OCP.BRep import BRep_Tool
+from OCP.BRepBndLib import BRepBndLib
+from OCP.TopAbs import TopAbs_VERTEX
+
+from ocp_tessellate.ocp_utils import *
+from ocp_tessellate.ocp_utils import _get_map
+
+from _base import MyUnitTest
+
+
+def x_range(shape):
+    bb = Bnd_Box()
+    BRepBndLib.Add_s(shape, bb)
+    return bb.CornerMin().X(), bb.CornerMax().X()
+
+
+class TestSubShapes(MyUnitTest):
+    """Tests for the cached sub shape maps of located shapes"""
+
+    def test_moved_copies(self):
+        box = Box(1, 1, 1).wrapped
+        # second round: more located copies after the first ones were released
+        for _ in range(2):
+            for i in range(50):
+                moved = box.Moved(Location((i, 0, 0)).wrapped)
+                xs = [BRep_Tool.Pnt_s(v).X() for v in get_vertices(moved)]
+                self._assertTupleAlmostEquals((i - 0.5, i + 0.5), (min(xs), max(xs)), 6)
+                faces = list(get_faces(moved))
+                self.assertEqual(len(faces), 6)
+                self.assertAlmostEqual(min(x_range(f)[0] for f in faces), i - 0.5, 6)
+
+    def test_cache_key(self):
+        box = Box(1, 1, 1).wrapped
+        loc = Location((1, 0, 0)).wrapped
+        m1 = box.Moved(loc)
+        m2 = box.Moved(loc)  # a new wrapper of an equal shape
+        m3 = box.Moved(Location((2, 0, 0)).wrapped)
+        # equal shapes share the map, differently located copies don't
+        self.assertIs(_get_map(m1, TopAbs_VERTEX), _get_map(m2, TopAbs_VERTEX))
+        self.assertIsNot(_get_map(m1, TopAbs_VERTEX), _get_map(m3, TopAbs_VERTEX))
+        self.assertIsNot(
+            _get_map(m1, TopAbs_VERTEX), _get_map(m1.Reversed(), TopAbs_VERTEX)
+        )
+
+    def test_moved_copies_with_face(self):
+        box = Box(1, 1, 1).wrapped
+        for i in range(50):
+            moved = box.Moved(Location((i, 0, 0)).wrapped)
+            pairs = list(get_edges(moved, with_face=True))
+            self.assertEqual(len(pairs), 12)
+            for edge, face in pairs:
+                e_min, e_max = x_range(edge)
+                f_min, f_max = x_range(face)
+                self.assertGreaterEqual(e_min, i - 0.5 - 1e-6)
+                # the edge lies on its (equally located) face
+                self.assertGreaterEqual(e_min, f_min - 1e-6)
+                self.assertLessEqual(e_max, f_max + 1e-6)
+
+
+class TestIdentityLocation(MyUnitTest):
+    """Tests for identity_location"""
+
+    def test_fresh_instance(self):
+        loc = identity_location()
+        face = (Pos(4.5, 0, 0) * Box(1, 1, 1)).faces()[0].wrapped
+        BRepMesh_IncrementalMesh(face, 0.1)
+        BRep_Tool.Triangulation_s(face, loc)  # writes the face location into loc
+        t, _ = loc_to_tq(identity_location())
+        self._assertTupleAlmostEquals((0, 0, 0), t, 6)
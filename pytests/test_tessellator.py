@@ -0,0 +1,132 @@
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+from build123d import *
+
+from ocp_tessellate.ocp_utils import BoundingBox
+from ocp_tessellate import tessellator
+from ocp_tessellate.tessellator import (
+    NATIVE,
+    Tessellator,
+    bbox_edges,
+    compute_quality,
+    discretize_edges,
+    get_size,
+)
+from ocp_tessellate.utils import round_bits
+
+
+class TestTessellator(unittest.TestCase):
+    """Tests for the python tessellator"""
+
+    def tessellate(self, obj, compute_edges=True):
+        t = Tessellator("/Group/obj")
+        t.compute(obj.wrapped, 0.01, 0.2, True, compute_edges)
+        return t
+
+    def test_shapes(self):
+        t = self.tessellate(Pos(1, 2, 3) * Box(1, 2, 3))
+        vertices = t.get_vertices()
+        triangles = t.get_triangles()
+        self.assertEqual(vertices.dtype, np.float32)
+        self.assertEqual(triangles.dtype, np.int32)
+        self.assertEqual(t.get_normals().shape, vertices.shape)
+        self.assertEqual(t.get_edges().shape, (24, 3))
+        self.assertEqual(triangles.max(), len(vertices) // 3 - 1)
+        self.assertEqual(sum(t.get_triangles_per_face()), len(triangles) // 3)
+        np.testing.assert_allclose(
+            vertices.reshape(-1, 3).min(axis=0), (0.5, 1, 1.5), atol=1e-6
+        )
+
+    def test_missing_normals(self):
+        t = self.tessellate(Sphere(1), compute_edges=False)
+        t.normals = []
+        normals = t.get_normals().reshape(-1, 3)
+        vertices = t.get_vertices().reshape(-1, 3)
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1, atol=1e-6)
+        # blended face normals of a sphere point away from the center
+        self.assertGreater(np.einsum("ij,ij->i", normals, vertices).min(), 0.99)
+
+    def test_missing_edges(self):
+        t = self.tessellate(Box(1, 1, 1), compute_edges=False)
+        t._compute_missing_edges()
+        edges = t.get_edges()
+        triangles = t.get_triangles().reshape(-1, 3)
+        vertices = t.get_vertices().reshape(-1, 3)
+        self.assertEqual(edges.shape, (3 * len(triangles), 2, 3))
+        np.testing.assert_array_equal(edges[0], vertices[triangles[0, :2]])
+        np.testing.assert_array_equal(edges[2, 1], vertices[triangles[0, 0]])
+
+
+class TestDiscretizeEdges(unittest.TestCase):
+    """Tests for edge discretization"""
+
+    def test_shared_vertices(self):
+        edges = [e.wrapped for e in Box(1, 1, 1).edges()]
+        result = discretize_edges(edges, 0.01)
+        self.assertEqual(len(result["segments_per_edge"]), 12)
+        # 12 edges of a box share 8 vertices
+        self.assertEqual(result["obj_vertices"].shape, (24,))
+
+
+class TestCacheSize(unittest.TestCase):
+    """Tests for the tessellation cache accounting"""
+
+    def test_get_size(self):
+        result = {
+            "vertices": np.zeros(300, dtype=np.float32),
+            "triangles": np.zeros(30, dtype=np.int32),
+        }
+        self.assertGreaterEqual(get_size(result), 1320)
+        self.assertLess(get_size(result), 1320 + 1024)
+
+    def test_get_size_non_array(self):
+        result = {"vertices": np.zeros(300, dtype=np.float32), "edges": [], "bb": None}
+        self.assertGreaterEqual(get_size(result), 1200)
+
+
+class TestQuality(unittest.TestCase):
+    """Tests for the quantized tessellation quality"""
+
+    def test_round_bits(self):
+        self.assertEqual(round_bits(0, 10), 0)
+        self.assertEqual(round_bits(1.0, 10), 1.0)
+        self.assertAlmostEqual(round_bits(0.0123456, 10), 0.0123456, delta=2e-5)
+        self.assertAlmostEqual(round_bits(-345.678, 10), -345.678, delta=0.5)
+
+    def test_stable_quality(self):
+        q1 = compute_quality(BoundingBox(Box(10, 20, 30).wrapped))
+        q2 = compute_quality(BoundingBox(Box(10 + 1e-9, 20, 30).wrapped))
+        self.assertEqual(q1, q2)
+        self.assertAlmostEqual(q1, 0.02, delta=1e-4)
+
+
+class TestBboxEdges(unittest.TestCase):
+    """Tests for the bounding box wireframe"""
+
+    def test_bbox_edges(self):
+        bb = {"xmin": -1, "xmax": 2, "ymin": -3, "ymax": 4, "zmin": 5, "zmax": 6}
+        edges = bbox_edges(bb).reshape(12, 2, 3)
+        np.testing.assert_array_equal(edges.min(axis=(0, 1)), (-1, -3, 5))
+        np.testing.assert_array_equal(edges.max(axis=(0, 1)), (2, 4, 6))
+        # every edge is axis parallel
+        self.assertTrue(((edges[:, 0] != edges[:, 1]).sum(axis=1) == 1).all())
+
+
+@unittest.skipUnless(NATIVE, "ocp_addons is not installed")
+class TestNativeSwitch(unittest.TestCase):
+    """Tests for the NATIVE_TESSELLATOR environment switch"""
+
+    def enabled(self, value):
+        env = {} if value is None else {"NATIVE_TESSELLATOR": value}
+        with mock.patch.dict(os.environ, env, clear=True):
+            return tessellator.is_native_tessellator_enabled()
+
+    def test_switch(self):
+        self.assertTrue(self.enabled(None))
+        self.assertTrue(self.enabled("1"))
+        self.assertFalse(self.enabled("0"))
+        self.assertFalse(self.enabled(""))
+        self.assertFalse(self.enabled("off"))